@@ -0,0 +1,8 @@
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, "components", "custom", "TemplateBuilder", "data")
+
+# Bump when a change to the shared build code should invalidate every cached category
+GENERATOR_VERSION = 3
+DEFAULT_SEED = 0
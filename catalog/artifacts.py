@@ -0,0 +1,144 @@
+"""Content-hashed, pre-compressed build artifacts for immutable CDN caching.
+
+Each output file is copied to `<stem>.<hash><ext>` in the artifact directory
+together with `.gz` (level 9) and `.br` (quality 11) siblings, so the files
+can be served with `Cache-Control: immutable` and the edge never compresses
+on the fly. Shard and chunk directories are published file by file and their
+manifest is rewritten to point at the hashed names.
+
+The asset map (catalog-assets.json) maps each logical name to its URL:
+
+    {"textStyles.json": {"url": "/catalog/textStyles.1a2b3c4d5e6f.json",
+                         "bytes": 88031, "gzip": 6120, "br": 4987,
+                         "version": "9f86d081884c7d65"}, ...}
+
+Thumbnail atlases and the icon sprite are referenced from inside catalog
+items, so their stages publish them the same way (publish_data()) before the
+catalog is written, and the generators add their entries to the map.
+
+Catalog entries (and shard manifests) carry the catalog "version", the hash
+delta patches use as "from"/"to", so a client can look up its patch without
+downloading and hashing the catalog first.
+"""
+import gzip
+import hashlib
+import json
+import os
+
+from catalog import ROOT_DIR
+from catalog.files import write_file
+
+try:
+    import brotli
+except ImportError:  # optional, only needed for the artifact stage
+    brotli = None
+
+ARTIFACT_DIR = os.path.join(ROOT_DIR, "public", "catalog")
+ARTIFACT_URL = "/catalog"
+ASSET_MAP = "catalog-assets.json"
+
+
+class ArtifactError(Exception):
+    pass
+
+
+def hashed_name(filename, data):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+
+
+def _publish_file(name, data, out_dir, base_url, compress=True):
+    filename = hashed_name(os.path.basename(name), data)
+    subdir = os.path.dirname(name)
+    path = os.path.join(out_dir, subdir, filename)
+    compressed = {}
+    if compress:
+        # mtime=0 keeps the .gz byte-identical across rebuilds of the same content
+        compressed["gzip"] = gzip.compress(data, 9, mtime=0)
+        if brotli is not None:
+            compressed["br"] = brotli.compress(data, quality=11)
+    for encoding, extension in (("gzip", ".gz"), ("br", ".br")):
+        if encoding in compressed:
+            write_file(path + extension, compressed[encoding])
+    write_file(path, data)
+    url = "/".join(part for part in (base_url.rstrip("/"), subdir, filename) if part)
+    return filename, {"url": url, "bytes": len(data), **{k: len(v) for k, v in compressed.items()}}
+
+
+def publish_data(name, data, out_dir=ARTIFACT_DIR, base_url=ARTIFACT_URL, compress=True):
+    """Publish generated bytes under a hashed `name`; returns its asset map entry.
+
+    For files the catalog itself links to. `compress=False` skips the .gz/.br
+    siblings for formats that are already compressed (WebP, PNG); .br is also
+    skipped when brotli is not installed.
+    """
+    return _publish_file(name, data, out_dir, base_url, compress)[1]
+
+
+def _publish_dir(path, out_dir, base_url):
+    # Shard (manifest "categories") and chunk (manifest "chunks") directories
+    name = os.path.basename(os.path.normpath(path))
+    with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    assets = {}
+    for entry in manifest.get("categories") or manifest.get("chunks") or []:
+        with open(os.path.join(path, entry["file"]), "rb") as f:
+            data = f.read()
+        logical = f"{name}/{entry['file']}"
+        entry["file"], assets[logical] = _publish_file(logical, data, out_dir, base_url)
+    data = json.dumps(manifest, indent=2).encode("utf-8")
+    _, assets[f"{name}/manifest.json"] = _publish_file(f"{name}/manifest.json", data, out_dir, base_url)
+    if "version" in manifest:
+        assets[f"{name}/manifest.json"]["version"] = manifest["version"]
+    return assets
+
+
+def publish(paths, out_dir=ARTIFACT_DIR, base_url=ARTIFACT_URL, versions=None):
+    """Publish built files or directories as hashed artifacts; returns their asset map entries.
+
+    `versions` maps file names to the catalog version recorded in their entry.
+    """
+    versions = versions or {}
+    if brotli is None:
+        raise ArtifactError("the artifact stage needs brotli for .br files: pip install brotli")
+    assets = {}
+    for path in paths:
+        if os.path.isdir(path):
+            assets.update(_publish_dir(path, out_dir, base_url))
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+            name = os.path.basename(path)
+            _, assets[name] = _publish_file(name, data, out_dir, base_url)
+            if name in versions:
+                assets[name]["version"] = versions[name]
+    return assets
+
+
+def write_asset_map(assets, path):
+    """Merge `assets` into the asset map at `path`, keeping other catalogs' entries.
+
+    Entries under a republished directory are replaced as a whole, so shards
+    that no longer exist drop out of the map.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            current = json.load(f)
+    except FileNotFoundError:
+        current = {}
+    dirs = {name.split("/")[0] + "/" for name in assets if "/" in name}
+    current = {name: entry for name, entry in current.items() if not name.startswith(tuple(dirs))}
+    current.update(assets)
+    write_file(path, json.dumps(current, indent=2, sort_keys=True) + "\n")
+    return current
+
+
+def publish_outputs(paths, map_dir, out_dir=ARTIFACT_DIR, base_url=ARTIFACT_URL, versions=None, extra=None):
+    """publish() plus an asset map update in `map_dir`; returns (map path, new entries).
+
+    `extra` holds entries already published with publish_data(), such as atlases.
+    """
+    assets = {**(extra or {}), **publish(paths, out_dir, base_url, versions)}
+    path = os.path.join(map_dir, ASSET_MAP)
+    write_asset_map(assets, path)
+    return path, assets
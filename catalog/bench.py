@@ -0,0 +1,169 @@
+"""Benchmark catalog generation and the client-side cost of its output.
+
+    python -m catalog.bench --out bench.json
+    python -m catalog.bench --baseline bench-baseline.json --threshold gzip=5 --threshold parse_ms=30
+
+For each catalog it reports per-category generation time, peak memory, item
+and duplicate counts, and for each output encoding the raw, gzip and brotli
+sizes and the time to json.loads it. With --baseline, every metric is compared
+against a stored report and the run exits non-zero if any metric grew by more
+than its threshold (percent).
+"""
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from catalog import DEFAULT_SEED
+from catalog.build import GENERATORS, generator
+from catalog.compact import encode
+from catalog.files import write_file
+from catalog.output import assemble, records
+from catalog.variants import build_category
+
+try:
+    import brotli
+except ImportError:  # optional, brotli sizes are reported as null without it
+    brotli = None
+
+# Allowed growth in percent before a metric counts as a regression
+DEFAULT_THRESHOLDS = {
+    "time_ms": 50,
+    "peak_kb": 20,
+    "items": 0,
+    "duplicates": 0,
+    "raw": 5,
+    "gzip": 5,
+    "brotli": 5,
+    "parse_ms": 50,
+}
+
+
+def _best_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def bench_category(category, seed, repeat):
+    # Exhaustion reports would repeat once per run; the item count already shows them
+    with contextlib.redirect_stdout(io.StringIO()):
+        time_ms = _best_ms(lambda: build_category(category, seed), repeat)
+        # Measured separately: tracemalloc slows allocation down considerably
+        stats = {}
+        tracemalloc.start()
+        items = build_category(category, seed, stats)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return items, {
+        "time_ms": round(time_ms, 3),
+        "peak_kb": round(peak / 1024, 1),
+        "items": len(items),
+        # Duplicates dropped by take_unique(): builds that render distinct choices the same
+        "duplicates": stats["duplicates"],
+    }
+
+
+def bench_output(data, repeat):
+    raw = data.encode("utf-8")
+    return {
+        "raw": len(raw),
+        "gzip": len(gzip.compress(raw, 9)),
+        "brotli": len(brotli.compress(raw, quality=11)) if brotli else None,
+        "parse_ms": round(statistics.median(_best_ms(lambda: json.loads(data), 1) for _ in range(repeat)), 3),
+    }
+
+
+def run(seed=DEFAULT_SEED, repeat=5):
+    report = {"seed": str(seed), "catalogs": {}}
+    for catalog in GENERATORS:
+        module = generator(catalog)
+        groups = []
+        categories = {}
+        for category in module.CATEGORIES:
+            items, metrics = bench_category(category, seed, repeat)
+            groups.append((category.name, items))
+            categories[category.name] = metrics
+        outputs = {
+            "json": bench_output(json.dumps(assemble(groups, module.NESTED), indent=2), repeat),
+            "compact": bench_output(json.dumps(encode(records(groups)), separators=(",", ":"), ensure_ascii=False), repeat),
+        }
+        report["catalogs"][catalog] = {"categories": categories, "outputs": outputs}
+    return report
+
+
+def _flatten(value, prefix=""):
+    if isinstance(value, dict):
+        for key, inner in value.items():
+            yield from _flatten(inner, f"{prefix}.{key}" if prefix else key)
+    else:
+        yield prefix, value
+
+
+def compare(report, baseline, thresholds):
+    """Return a list of (metric, old, new, allowed_pct) regressions."""
+    old = dict(_flatten(baseline.get("catalogs", {})))
+    regressions = []
+    for metric, new in _flatten(report["catalogs"]):
+        allowed = thresholds.get(metric.rsplit(".", 1)[-1])
+        previous = old.get(metric)
+        if allowed is None or new is None or previous is None:
+            continue
+        limit = previous * (1 + allowed / 100)
+        if new > limit:
+            regressions.append((metric, previous, new, allowed))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog generation and output cost.")
+    parser.add_argument("--seed", default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions (best/median is reported)")
+    parser.add_argument("--out", help="write the report to this JSON file")
+    parser.add_argument("--baseline", help="compare against this stored report")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite --baseline with this run's report")
+    parser.add_argument("--threshold", action="append", default=[], metavar="METRIC=PCT",
+                        help=f"allowed growth per metric in percent (defaults: {DEFAULT_THRESHOLDS})")
+    args = parser.parse_args()
+
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for item in args.threshold:
+        metric, _, pct = item.partition("=")
+        if metric not in DEFAULT_THRESHOLDS or not pct:
+            parser.error(f"invalid --threshold {item!r}")
+        thresholds[metric] = float(pct)
+
+    report = run(args.seed, args.repeat)
+    for catalog, result in report["catalogs"].items():
+        print(f"{catalog}:")
+        for name, m in result["categories"].items():
+            print(f"  {name:<12} {m['items']:>5} items  {m['duplicates']:>3} dup  {m['time_ms']:>8.2f} ms  {m['peak_kb']:>8.1f} KB peak")
+        for name, m in result["outputs"].items():
+            print(f"  [{name}] raw {m['raw']:,} B  gzip {m['gzip']:,} B  brotli {m['brotli'] or '-'} B  parse {m['parse_ms']:.2f} ms")
+
+    if args.out:
+        write_file(args.out, json.dumps(report, indent=2))
+    if args.baseline:
+        if args.update_baseline:
+            write_file(args.baseline, json.dumps(report, indent=2))
+            print(f"Baseline updated: {args.baseline}")
+            return
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), thresholds)
+        for metric, old, new, allowed in regressions:
+            print(f"REGRESSION {metric}: {old} -> {new} (allowed +{allowed:g}%)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
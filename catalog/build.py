@@ -0,0 +1,172 @@
+"""Build many catalog variants (locales, brand themes, count tiers) in parallel.
+
+Usage (from the repository root):
+
+    python -m catalog.build variants.json --out-dir build/catalogs --jobs 8
+
+`variants.json` holds a list of variant specs:
+
+    [
+      {
+        "name": "fr",
+        "seed": 0,
+        "catalogs": ["textStyles", "stockElements"],
+        "palette": ["#0f172a", "#e11d48", "#f59e0b"],
+        "axes": {"Headlines": {"text": ["DERNIÈRE MINUTE", "EXCLUSIF"]}},
+        "counts": {"buttons": 60},
+        "scale": 1.0
+      }
+    ]
+
+Only "name" is required. "palette" remaps every color axis onto a brand
+palette (see palette_axes() in each generator); explicit "axes" win over
+it. Every category of every variant is an independent task; results are
+collected in spec order and each category draws from its own seeded stream,
+so the output is identical to a serial run.
+"""
+import argparse
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import DEFAULT_SEED
+from catalog.cache import build_cached
+from catalog.colors import normalize_hex
+from catalog.output import write_catalog, write_stream
+from catalog.variants import build_category, with_overrides
+
+GENERATORS = {
+    "textStyles": "catalog.text_styles",
+    "stockElements": "catalog.elements",
+}
+
+
+def generator(catalog):
+    return importlib.import_module(GENERATORS[catalog])
+
+
+def build_groups(categories, seed=DEFAULT_SEED, cache_namespace=None):
+    """Build each category and return (name, items) pairs in declaration order."""
+    groups = []
+    for category in categories:
+        if cache_namespace:
+            items, _ = build_cached(category, seed, cache_namespace)
+        else:
+            items = build_category(category, seed)
+        groups.append((category.name, items))
+    return groups
+
+
+def variant_categories(spec, catalog):
+    """The categories of `catalog` with the spec's palette, axes and counts applied."""
+    module = generator(catalog)
+    axes = {}
+    if spec.get("palette"):
+        palette = [normalize_hex(color) for color in spec["palette"]]
+        axes = module.palette_axes(palette)
+    for name, overrides in spec.get("axes", {}).items():
+        axes[name] = {**axes.get(name, {}), **overrides}
+    counts = spec.get("counts", {})
+    scale = spec.get("scale", 1)
+    categories = []
+    for category in module.CATEGORIES:
+        count = category.count
+        if category.space is not None:
+            # Count tiers only grow sampled categories; fixed lists stay as they are
+            count = max(1, round(count * scale))
+        count = counts.get(category.name, count)
+        categories.append(with_overrides(category, axes.get(category.name), count))
+    return categories
+
+
+def _build_task(task):
+    spec, catalog, index, cache = task
+    category = variant_categories(spec, catalog)[index]
+    namespace = f"variants/{spec['name']}/{catalog}" if cache else None
+    return build_groups([category], spec.get("seed", DEFAULT_SEED), namespace)[0]
+
+
+def _stream_task(task):
+    spec, catalog, out_dir, layout, chunk_size, indent = task
+    categories = variant_categories(spec, catalog)
+    return write_stream(catalog, categories, spec.get("seed", DEFAULT_SEED), os.path.join(out_dir, spec["name"]),
+                        layout, chunk_size, indent)
+
+
+def stream_variants(specs, out_dir, layout, chunk_size=10000, indent=None, jobs=None):
+    """Stream every catalog of every spec to disk, one (variant, catalog) per worker."""
+    tasks = [
+        (spec, catalog, out_dir, layout, chunk_size, indent)
+        for spec in specs
+        for catalog in spec.get("catalogs", GENERATORS)
+    ]
+    if jobs == 1:
+        return list(map(_stream_task, tasks))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_stream_task, tasks))
+
+
+def build_variants(specs, jobs=None, cache=True):
+    """Build every catalog of every spec; returns {name: {catalog: groups}}."""
+    tasks = []
+    for spec in specs:
+        for catalog in spec.get("catalogs", GENERATORS):
+            # Resolve overrides up front so a bad spec fails before any work is scheduled
+            for index in range(len(variant_categories(spec, catalog))):
+                tasks.append((spec, catalog, index, cache))
+
+    if jobs == 1:
+        results = list(map(_build_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_build_task, tasks))
+
+    built = {}
+    for (spec, catalog, _, _), group in zip(tasks, results):
+        built.setdefault(spec["name"], {}).setdefault(catalog, []).append(group)
+    return built
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build catalog variants across a process pool.")
+    parser.add_argument("specs", help="JSON file with a list of variant specs")
+    parser.add_argument("--out-dir", required=True, help="each variant is written to <out-dir>/<name>/")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count, 1 = serial)")
+    parser.add_argument("--shard", action="store_true", help="write one file per category plus a manifest")
+    parser.add_argument("--compact", action="store_true", help="use the compact/1 encoding")
+    parser.add_argument("--no-cache", action="store_true", help="rebuild every category")
+    parser.add_argument("--minify", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--stream", choices=["ndjson", "chunks"], help="stream each catalog to disk with constant memory")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="records per file with --stream chunks")
+    args = parser.parse_args()
+    if args.stream and (args.shard or args.compact):
+        parser.error("--stream writes items as they are generated and can't be combined with --shard or --compact")
+
+    with open(args.specs, encoding="utf-8") as f:
+        specs = json.load(f)
+    names = [spec["name"] for spec in specs]
+    if len(set(names)) != len(names):
+        parser.error("variant names must be unique")
+    for spec in specs:
+        unknown = set(spec.get("catalogs", GENERATORS)) - set(GENERATORS)
+        if unknown:
+            parser.error(f"variant {spec['name']!r}: unknown catalogs {sorted(unknown)}")
+
+    start = time.perf_counter()
+    if args.stream:
+        paths = stream_variants(specs, args.out_dir, args.stream, args.chunk_size,
+                                None if args.minify else 2, jobs=args.jobs)
+        print(f"Streamed {len(paths)} catalogs in {time.perf_counter() - start:.2f}s")
+        return
+    built = build_variants(specs, jobs=args.jobs, cache=not args.no_cache)
+    for name, catalogs in built.items():
+        for catalog, groups in catalogs.items():
+            write_catalog(catalog, groups, os.path.join(args.out_dir, name), generator(catalog).NESTED,
+                          shard=args.shard, compact=args.compact, indent=None if args.minify else 2)
+    print(f"Built {len(built)} variants in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
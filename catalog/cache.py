@@ -0,0 +1,72 @@
+import hashlib
+import inspect
+import json
+import os
+
+from catalog import GENERATOR_VERSION, ROOT_DIR
+from catalog.files import write_file
+from catalog.shards import slugify
+from catalog.variants import build_category
+
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "catalog")
+
+
+def _source(func, seen):
+    # Source of the builder plus any module-level functions it calls, so editing a
+    # shared helper such as text_style() invalidates every category that uses it
+    if func in seen:
+        return ""
+    seen.add(func)
+    try:
+        parts = [inspect.getsource(func)]
+    except (OSError, TypeError):
+        parts = [getattr(func, "__qualname__", repr(func))]
+    if inspect.isfunction(func):
+        for name in _global_names(func.__code__):
+            value = func.__globals__.get(name)
+            if inspect.isfunction(value):
+                parts.append(_source(value, seen))
+    return "".join(parts)
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return sorted(names)
+
+
+def category_fingerprint(category, seed):
+    definition = {
+        "version": GENERATOR_VERSION,
+        "seed": str(seed),
+        "name": category.name,
+        "count": category.count,
+        "items": category.items,
+    }
+    if category.space is not None:
+        definition["axes"] = category.space.axes
+        definition["builder"] = _source(category.space.build, set())
+    canonical = json.dumps(definition, sort_keys=True, default=list, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_cached(category, seed, catalog, cache_dir=CACHE_DIR):
+    """Build a category, reusing the cached items if its fingerprint is unchanged.
+
+    Returns (items, rebuilt).
+    """
+    fingerprint = category_fingerprint(category, seed)
+    path = os.path.join(cache_dir, catalog, f"{slugify(category.name)}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["fingerprint"] == fingerprint:
+            return entry["items"], False
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+
+    items = build_category(category, seed)
+    write_file(path, json.dumps({"fingerprint": fingerprint, "items": items}, ensure_ascii=False))
+    return items, True
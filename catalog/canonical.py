@@ -0,0 +1,168 @@
+"""Canonical CSS values for catalog items.
+
+Every built item passes through canonicalize() before dedup, so styles that
+render the same are also written the same:
+
+- colors: lowercase 6-digit hex ('#FFF' -> '#ffffff'); translucent colors as
+  'rgba(r,g,b,a)' without spaces, opaque rgb()/rgba() as hex
+- lengths: a single px length is a number ('10px' -> 10); shorthands keep
+  their units, drop redundant sides ('8px 4px 8px 4px' -> '8px 4px') and
+  write zero as '0'
+- font weights: numeric strings ('bold' -> '700', 'normal' -> '400')
+- shadows, borders and strokes: the same rules per token, shadows joined by ', '
+
+Item keys and style/payload properties are checked against the schema below
+and unknown ones raise ValueError, so a typo in a builder fails the build
+instead of shipping. Value conversions are memoized in bounded caches, since
+catalogs repeat a small set of values many times.
+"""
+import functools
+import re
+
+from catalog.colors import HEX, normalize_hex
+
+ITEM_KEYS = {"id", "category", "label", "icon", "type", "preview", "previewType", "style", "payload"}
+
+NUMBER = re.compile(r"(-?(?:\d+\.?\d*|\.\d+))([a-z%]*)")
+RGB = re.compile(r"rgba?\(\s*([^)]*)\)")
+# Commas and whitespace inside parentheses don't separate shadows or tokens
+TOP_LEVEL_COMMA = re.compile(r",(?![^(]*\))")
+TOKEN = re.compile(r"[^\s(]+(?:\([^)]*\))?")
+FONT_WEIGHTS = {"normal": "400", "bold": "700"}
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+@functools.lru_cache(maxsize=4096)
+def color(value):
+    value = value.strip()
+    if value.startswith("#"):
+        return normalize_hex(value) if HEX.fullmatch(value) else value.lower()
+    match = RGB.fullmatch(value)
+    if match:
+        parts = [p.strip() for p in re.split(r"[\s,/]+", match.group(1).strip())]
+        if len(parts) in (3, 4):
+            rgb = [int(_number(p)) for p in parts[:3]]
+            alpha = _number(parts[3]) if len(parts) == 4 else 1
+            if alpha == 1:
+                return "#" + "".join(f"{c:02x}" for c in rgb)
+            return f"rgba({rgb[0]},{rgb[1]},{rgb[2]},{alpha})"
+    return value.lower() if value.isalpha() else value
+
+
+def _token(token):
+    if token.startswith(("#", "rgb")):
+        return color(token)
+    match = NUMBER.fullmatch(token)
+    if not match:
+        return token
+    number, unit = _number(match.group(1)), match.group(2)
+    # Zero needs no unit; a unitless non-zero length would be invalid CSS, so it is left alone
+    return "0" if number == 0 else f"{number}{unit}"
+
+
+@functools.lru_cache(maxsize=4096)
+def tokens(value):
+    """Border, stroke and single-shadow values: canonicalize each token."""
+    return " ".join(_token(token) for token in TOKEN.findall(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def shadow(value):
+    return ", ".join(tokens(part) for part in TOP_LEVEL_COMMA.split(value))
+
+
+def _px(token):
+    match = NUMBER.fullmatch(token)
+    if match and match.group(2) in ("px", ""):
+        return _number(match.group(1))
+    return None
+
+
+def length(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _number(value)
+    return _shorthand(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _shorthand(value):
+    sides = [_token(token) for token in value.split()]
+    # top right bottom left -> drop sides that repeat their opposite
+    if len(sides) == 4 and sides[3] == sides[1]:
+        sides.pop()
+    if len(sides) == 3 and sides[2] == sides[0]:
+        sides.pop()
+    if len(sides) == 2 and sides[1] == sides[0]:
+        sides.pop()
+    if len(sides) == 1 and _px(sides[0]) is not None:
+        return _px(sides[0])
+    return " ".join(sides)
+
+
+def font_weight(value):
+    value = str(value).strip().lower()
+    return FONT_WEIGHTS.get(value, value)
+
+
+def number(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _number(value)
+    match = NUMBER.fullmatch(value.strip()) if isinstance(value, str) else None
+    if match and not match.group(2):
+        return _number(match.group(1))
+    return value
+
+
+def text(value):
+    return value
+
+
+PROPERTIES = {
+    "color": color,
+    "backgroundColor": color,
+    "fontSize": length,
+    "letterSpacing": length,
+    "padding": length,
+    "borderRadius": length,
+    "width": length,
+    "height": length,
+    "fontWeight": font_weight,
+    "lineHeight": number,
+    "textShadow": shadow,
+    "boxShadow": shadow,
+    "border": tokens,
+    "WebkitTextStroke": tokens,
+    "fontFamily": text,
+    "fontStyle": text,
+    "textAlign": text,
+    "textTransform": text,
+    "transform": text,
+    "content": text,
+    "src": text,
+}
+
+
+def _properties(values, where):
+    canonical = {}
+    for name, value in values.items():
+        convert = PROPERTIES.get(name)
+        if convert is None:
+            raise ValueError(f"{where}: unknown property {name!r}")
+        canonical[name] = convert(value)
+    return canonical
+
+
+def canonicalize(item):
+    """Copy of `item` with canonical style/payload values; raises ValueError on unknown keys."""
+    unknown = set(item) - ITEM_KEYS
+    if unknown:
+        raise ValueError(f"{item.get('label', item.get('id'))!r}: unknown item keys {sorted(unknown)}")
+    item = dict(item)
+    for section in ("style", "payload"):
+        if section in item:
+            item[section] = _properties(item[section], f"{item.get('label', item.get('id'))!r} {section}")
+    return item
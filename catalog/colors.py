@@ -0,0 +1,146 @@
+"""Hex color parsing and batched WCAG contrast math.
+
+Everything past normalize_hex() works on whole arrays of colors at once with
+NumPy, so palette-aware variant generation can check every foreground /
+background combination and build shade/tint ramps in one pass.
+
+NumPy is imported on first use, so modules that only need the hex helpers
+(canonical.py, and through it every build) don't pay for loading it.
+"""
+import re
+
+# Bound by _require_numpy()
+np = None
+
+HEX = re.compile(r"#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+# WCAG 2.x minimum contrast ratios (AA); AA_LARGE is also the minimum for graphics such as borders
+AA_NORMAL = 4.5
+AA_LARGE = 3.0
+
+# Default TemplateBuilder canvas background, behind anything drawn without its own background
+CANVAS = "#ffffff"
+
+
+def normalize_hex(value):
+    """'#FFF', 'fff' or '#ffffff' -> '#ffffff'; raises ValueError otherwise."""
+    match = HEX.fullmatch(value.strip())
+    if not match:
+        raise ValueError(f"Not a hex color: {value!r}")
+    digits = match.group(1).lower()
+    if len(digits) == 3:
+        digits = "".join(c * 2 for c in digits)
+    return f"#{digits}"
+
+
+def _require_numpy():
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy as np
+    except ImportError:  # optional, only needed for palette theming
+        raise RuntimeError("NumPy is required for palette theming (pip install numpy)") from None
+
+
+def hex_to_rgb(colors):
+    """List of hex colors (short forms allowed) -> float array of shape (n, 3) in [0, 1]."""
+    _require_numpy()
+    packed = bytes.fromhex("".join(normalize_hex(c)[1:] for c in colors))
+    return np.frombuffer(packed, dtype=np.uint8).reshape(-1, 3) / 255.0
+
+
+def rgb_to_hex(rgb):
+    _require_numpy()
+    channels = np.clip(np.rint(np.asarray(rgb) * 255), 0, 255).astype(np.uint8).reshape(-1, 3)
+    return ["#" + bytes(row).hex() for row in channels]
+
+
+def luminance(rgb):
+    """WCAG relative luminance over the last axis of an sRGB array."""
+    _require_numpy()
+    rgb = np.asarray(rgb, dtype=float)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast(lum_a, lum_b):
+    """Contrast ratio between luminance arrays (broadcasting)."""
+    _require_numpy()
+    return (np.maximum(lum_a, lum_b) + 0.05) / (np.minimum(lum_a, lum_b) + 0.05)
+
+
+def contrast_matrix(foregrounds, backgrounds):
+    """Contrast ratio of every foreground against every background, shape (n_fg, n_bg)."""
+    fg = luminance(hex_to_rgb(foregrounds))
+    bg = luminance(hex_to_rgb(backgrounds))
+    return contrast(fg[:, None], bg[None, :])
+
+
+def ramp(rgb, target, steps):
+    """Mix each color towards `target` in `steps` even steps (step 0 is the color itself).
+
+    `target` is an RGB triple or an (n, 3) array; returns shape (n, steps, 3).
+    """
+    _require_numpy()
+    t = np.linspace(0.0, 1.0, steps)[None, :, None]
+    rgb = np.asarray(rgb, dtype=float)[:, None, :]
+    target = np.broadcast_to(np.asarray(target, dtype=float), (rgb.shape[0], 3))[:, None, :]
+    return rgb + (target - rgb) * t
+
+
+def best_text(backgrounds, candidates):
+    """For each background, the candidate text color with the highest contrast."""
+    ratios = contrast_matrix(candidates, backgrounds)
+    best = ratios.argmax(axis=0)
+    return [candidates[i] for i in best], ratios[best, np.arange(len(backgrounds))]
+
+
+def ensure_contrast(colors, text, min_ratio=AA_NORMAL, steps=41):
+    """Adjust each color as little as possible so `text` on it reaches `min_ratio`.
+
+    `text` is one hex color or one per color. Each color is walked along a
+    ramp towards black and one towards white, and the nearest step that passes
+    on either is kept; on a tie the ramp away from the text color wins (darker
+    under light text, lighter under dark text). Colors that already pass are
+    returned unchanged. Raises ValueError if no step passes, which only happens
+    for ratios above about 4.58 against mid-luminance text.
+    """
+    rgb = hex_to_rgb(colors)
+    text_rgb = hex_to_rgb([text] * len(colors) if isinstance(text, str) else text)
+    text_lum = luminance(text_rgb)
+    # Text exactly as light as the color (white on white) darkens first
+    away = np.where((text_lum >= luminance(rgb))[:, None], 0.0, 1.0)
+    candidates = np.stack([ramp(rgb, away, steps), ramp(rgb, 1.0 - away, steps)], axis=1)
+    # Check the colors as they will be written, so rounding to hex can't drop one below the ratio
+    candidates = np.rint(candidates * 255) / 255
+    passing = contrast(luminance(candidates), text_lum[:, None, None]) >= min_ratio
+    # argmax finds the first passing step of each ramp; `steps` marks a ramp that never passes
+    first = np.where(passing.any(axis=2), passing.argmax(axis=2), steps)
+    direction = first.argmin(axis=1)
+    rows = np.arange(len(colors))
+    step = first[rows, direction]
+    if (step == steps).any():
+        failing = [color for color, s in zip(colors, step) if s == steps]
+        raise ValueError(f"No shade or tint of {failing} reaches {min_ratio}:1 against the text color")
+    return rgb_to_hex(candidates[rows, direction, step])
+
+
+def on_canvas(colors, min_ratio=AA_LARGE):
+    """`colors` adjusted to reach `min_ratio` against the canvas, without repeats.
+
+    For colors painted straight on the canvas: large text, strokes and borders.
+    """
+    return list(dict.fromkeys(ensure_contrast(colors, CANVAS, min_ratio)))
+
+
+def accessible_pairs(backgrounds, candidates, min_ratio=AA_NORMAL):
+    """(background, text) pairs for a palette, each meeting `min_ratio`.
+
+    Text is the best candidate for each background; backgrounds that can't
+    reach the ratio with any candidate are shaded or tinted until they do.
+    """
+    text, ratios = best_text(backgrounds, candidates)
+    adjusted = ensure_contrast(backgrounds, text, min_ratio)
+    backgrounds = [bg if ok else fixed for bg, fixed, ok in zip(backgrounds, adjusted, ratios >= min_ratio)]
+    return list(dict.fromkeys(zip(backgrounds, text)))
@@ -0,0 +1,104 @@
+"""Dictionary-encoded catalog format ("compact/1").
+
+Layout:
+
+    {
+      "format": "compact/1",
+      "columns": ["category", "label", ...],
+      "strings": [...],            # interned strings, most frequent first
+      "objects": [[k, v, ...]],    # unique style/payload objects as key/value cells
+      "items": [[cell, ...], ...]  # one row per item, one cell per column
+    }
+
+Every cell (item columns, object keys and object values) is one of:
+
+    n >= 0   -> strings[n]
+    n < 0    -> objects[-n - 1]
+    [x]      -> the literal scalar x (number, boolean or null)
+    null     -> field absent (item rows only)
+
+The reference decoder lives in components/custom/TemplateBuilder/utils/decodeCatalog.ts.
+"""
+import json
+from collections import Counter
+
+FORMAT = "compact/1"
+
+
+def _count_strings(value, counts):
+    if isinstance(value, str):
+        counts[value] += 1
+    elif isinstance(value, dict):
+        for key, inner in value.items():
+            counts[key] += 1
+            _count_strings(inner, counts)
+
+
+def encode(records):
+    """Encode a flat list of records (dicts) into the compact/1 layout."""
+    columns = []
+    counts = Counter()
+    for record in records:
+        for key, value in record.items():
+            if key not in columns:
+                columns.append(key)
+            _count_strings(value, counts)
+
+    strings = [s for s, _ in sorted(counts.items(), key=lambda kv: -kv[1])]
+    string_index = {s: i for i, s in enumerate(strings)}
+    objects = []
+    object_index = {}
+
+    def cell(value):
+        if isinstance(value, str):
+            return string_index[value]
+        if isinstance(value, dict):
+            encoded = []
+            for key, inner in value.items():
+                encoded.append(string_index[key])
+                encoded.append(cell(inner))
+            # Canonical text of the encoded object is the dedup key
+            signature = json.dumps(encoded, separators=(",", ":"))
+            if signature not in object_index:
+                object_index[signature] = len(objects)
+                objects.append(encoded)
+            return -object_index[signature] - 1
+        if isinstance(value, list):
+            raise TypeError("compact/1 does not support list values")
+        return [value]
+
+    items = [[cell(record[c]) if c in record else None for c in columns] for record in records]
+    return {
+        "format": FORMAT,
+        "columns": columns,
+        "strings": strings,
+        "objects": objects,
+        "items": items,
+    }
+
+
+def decode(data):
+    """Reference decoder, the inverse of encode()."""
+    if data.get("format") != FORMAT:
+        raise ValueError(f"Unsupported catalog format: {data.get('format')!r}")
+    strings = data["strings"]
+    objects = data["objects"]
+    cache = {}
+
+    def value(cell):
+        if isinstance(cell, list):
+            return cell[0]
+        if cell >= 0:
+            return strings[cell]
+        index = -cell - 1
+        if index not in cache:
+            encoded = objects[index]
+            cache[index] = {strings[encoded[i]]: value(encoded[i + 1]) for i in range(0, len(encoded), 2)}
+        # Hand out copies so callers can mutate decoded items independently
+        return dict(cache[index])
+
+    columns = data["columns"]
+    return [
+        {column: value(cell) for column, cell in zip(columns, row) if cell is not None}
+        for row in data["items"]
+    ]
@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+
+def item_hash(item):
+    # Content only: two items that render the same are duplicates whatever their IDs
+    item = {key: value for key, value in item.items() if key != "id"}
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def take_unique(candidates, count, label, stats=None):
+    """Take up to `count` distinct items from the iterable `candidates`.
+
+    Duplicates (by canonical content hash) are dropped and further candidates
+    are pulled to backfill. Candidates come from finite variant spaces, so the
+    source is only exhausted once it runs out; the shortfall is then reported.
+    If `stats` is a dict, the number of dropped duplicates is stored in it.
+    """
+    seen = set()
+    items = []
+    duplicates = 0
+    for item in candidates:
+        digest = item_hash(item)
+        if digest in seen:
+            duplicates += 1
+            continue
+        seen.add(digest)
+        items.append(item)
+        if len(items) == count:
+            break
+
+    if stats is not None:
+        stats["duplicates"] = duplicates
+    if len(items) < count:
+        print(f"{label}: variant space exhausted at {len(items)} unique items "
+              f"(requested {count}, {duplicates} duplicates dropped)")
+    return items
@@ -0,0 +1,172 @@
+"""Delta patches between two builds of a catalog ("catalog-patch/1").
+
+Items are matched by their stable "id" (see variants.item_id), so a patch
+only carries what actually changed:
+
+    {
+      "format": "catalog-patch/1",
+      "catalog": "stockElements",
+      "from": "<hash of the old records>",
+      "to": "<hash of the new records>",
+      "remove": [id, ...],
+      "add": [record, ...],                       # full records, in new order
+      "modify": [{"id": id, "set": {...}, "unset": [...]}, ...],
+      "order": [id, ...]                          # only if the order changed
+    }
+
+`modify` entries replace whole top-level fields. Without "order", the new
+catalog is the old one minus the removed IDs, with the added records appended.
+Clients check "from" against the catalog they hold and "to" after applying;
+on any mismatch they fall back to fetching the full catalog.
+
+    python -m catalog.delta OLD NEW [-o PATCH]
+"""
+import argparse
+import hashlib
+import json
+import os
+
+from catalog.compact import decode
+from catalog.files import write_file
+
+PATCH_FORMAT = "catalog-patch/1"
+
+
+def records_hash(records):
+    canonical = json.dumps(records, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _flatten(data):
+    if isinstance(data, dict):
+        return decode(data)
+    if data and "items" in data[0] and "id" not in data[0]:
+        # Nested layout: [{"category": ..., "items": [...]}, ...]
+        return [{"category": group["category"], **item} if "category" not in item else item
+                for group in data for item in group["items"]]
+    return data
+
+
+def load_records(path):
+    """Read a built catalog (plain, nested, compact or sharded) as flat records."""
+    if os.path.isdir(path):
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        records = []
+        for entry in manifest["categories"]:
+            with open(os.path.join(path, entry["file"]), encoding="utf-8") as f:
+                data = json.load(f)
+            records.extend(item if "category" in item else {"category": entry["category"], **item}
+                           for item in _flatten(data))
+        return records
+    with open(path, encoding="utf-8") as f:
+        return _flatten(json.load(f))
+
+
+def _by_id(records):
+    index = {}
+    for record in records:
+        if "id" not in record:
+            raise ValueError("catalog records have no IDs; rebuild the catalog with the current generator")
+        if record["id"] in index:
+            raise ValueError(f"duplicate item ID {record['id']!r}")
+        index[record["id"]] = record
+    return index
+
+
+def diff(old, new, catalog=None):
+    """Patch that turns the `old` record list into `new`."""
+    old_index = _by_id(old)
+    new_index = _by_id(new)
+
+    remove = [id_ for id_ in old_index if id_ not in new_index]
+    add = [record for record in new if record["id"] not in old_index]
+    modify = []
+    for record in new:
+        previous = old_index.get(record["id"])
+        if previous is None or previous == record:
+            continue
+        changed = {key: value for key, value in record.items() if previous.get(key, object()) != value}
+        dropped = [key for key in previous if key not in record]
+        entry = {"id": record["id"], "set": changed}
+        if dropped:
+            entry["unset"] = dropped
+        modify.append(entry)
+
+    patch = {
+        "format": PATCH_FORMAT,
+        "catalog": catalog,
+        "from": records_hash(old),
+        "to": records_hash(new),
+        "remove": remove,
+        "add": add,
+        "modify": modify,
+    }
+    expected = [id_ for id_ in old_index if id_ in new_index] + [record["id"] for record in add]
+    order = [record["id"] for record in new]
+    if expected != order:
+        patch["order"] = order
+    return patch
+
+
+def apply(old, patch):
+    """Reference implementation of applying a patch; the inverse of diff()."""
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError(f"Unsupported patch format: {patch.get('format')!r}")
+    if records_hash(old) != patch["from"]:
+        raise ValueError("patch does not apply to this catalog version")
+
+    removed = set(patch["remove"])
+    index = {record["id"]: dict(record) for record in old if record["id"] not in removed}
+    for entry in patch["modify"]:
+        record = index[entry["id"]]
+        record.update(entry["set"])
+        for key in entry.get("unset", ()):
+            del record[key]
+    for record in patch["add"]:
+        index[record["id"]] = record
+
+    order = patch.get("order") or list(index)
+    new = [index[id_] for id_ in order]
+    if records_hash(new) != patch["to"]:
+        raise ValueError("patched catalog does not match the target version")
+    return new
+
+
+def write_patch(old, new, out_dir, catalog):
+    """Diff two record lists and write `<catalog>.<from>.patch.json`; returns (path, patch).
+
+    Naming the file after the version it applies to lets a client with a cached
+    catalog look up its patch directly.
+    """
+    patch = diff(old, new, catalog)
+    path = os.path.join(out_dir, f"{catalog}.{patch['from']}.patch.json")
+    write_file(path, json.dumps(patch, separators=(",", ":"), ensure_ascii=False))
+    return path, patch
+
+
+def summary(patch):
+    return (f"{len(patch['add'])} added, {len(patch['remove'])} removed, "
+            f"{len(patch['modify'])} modified{', reordered' if 'order' in patch else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a delta patch between two builds of a catalog.")
+    parser.add_argument("old", help="previous build (JSON file, compact file or shard directory)")
+    parser.add_argument("new", help="new build, in any layout")
+    parser.add_argument("-o", "--out", help="patch file to write (default: print a summary only)")
+    args = parser.parse_args()
+
+    old = load_records(args.old)
+    new = load_records(args.new)
+    try:
+        patch = diff(old, new)
+    except ValueError as e:
+        parser.exit(1, f"error: {e}\n")
+    if args.out:
+        write_file(args.out, json.dumps(patch, separators=(",", ":"), ensure_ascii=False))
+    print(f"{patch['from']} -> {patch['to']}: {summary(patch)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""The stock elements catalog ("stockElements"): shapes, frames, buttons, badges and titles.
+
+Importing the module only defines the categories; nothing is built or written
+until generate_elements() or main() is called.
+"""
+import argparse
+import os
+import sys
+
+from catalog import DATA_DIR, DEFAULT_SEED
+from catalog.artifacts import ARTIFACT_DIR, ARTIFACT_URL, ASSET_MAP, ArtifactError, publish_outputs, write_asset_map
+from catalog.build import build_groups
+from catalog.colors import CANVAS, accessible_pairs, ensure_contrast, on_canvas
+from catalog.delta import load_records, records_hash, summary, write_patch
+from catalog.icons import DEFAULT_COLLECTION, IconCollection, UnresolvedIconError, bundle_icons, iconify_url
+from catalog.output import assemble, records, write_catalog, write_stream
+from catalog.search import write_index
+from catalog.thumbnails import ThumbnailError, build_atlas
+from catalog.variants import Category, VariantSpace, select
+
+CATALOG = "stockElements"
+NESTED = True
+
+# Lucide icon name -> mdi icon name, where lowercasing the Lucide name isn't enough
+MDI_NAMES = {
+    "Zap": "lightning-bolt",
+    "MessageCircle": "message",
+    "Sun": "white-balance-sunny",
+    "Moon": "moon-waning-crescent",
+    "Check": "check-bold",
+    "X": "close-thick",
+    "ArrowRight": "arrow-right",
+    "ArrowLeft": "arrow-left",
+    "Diamond": "cards-diamond",
+    "CircleDot": "ring",
+    "User": "account",
+    "Settings": "cog",
+    "Search": "magnify",
+}
+
+def shape_items():
+    shapes_items = []
+    basic_shapes = [
+        ("Rectangle", "Square", "rectangle"), ("Circle", "Circle", "circle"),
+        ("Triangle", "Triangle", "image"), ("Star", "Star", "image"),
+        ("Heart", "Heart", "image"), ("Hexagon", "Hexagon", "image"),
+        ("Octagon", "Octagon", "image"), ("Pentagon", "Pentagon", "image"),
+        ("Cloud", "Cloud", "image"), ("Message", "MessageCircle", "image"),
+        ("Zap", "Zap", "image"), ("Sun", "Sun", "image"),
+        ("Moon", "Moon", "image"), ("Check", "Check", "image"),
+        ("X", "X", "image"), ("Shield", "Shield", "image"),
+        ("Tag", "Tag", "image"), ("Bookmark", "Bookmark", "image"),
+        ("Arrow R", "ArrowRight", "image"), ("Arrow L", "ArrowLeft", "image"),
+        ("Diamond", "Diamond", "image"), ("Ring", "CircleDot", "image"),
+        ("User", "User", "image"), ("Home", "Home", "image"),
+        ("Settings", "Settings", "image"), ("Search", "Search", "image"),
+        ("Bell", "Bell", "image")
+    ]
+    
+    # Add basic shapes
+    for label, icon, type_ in basic_shapes:
+        payload = {}
+        if type_ == "image":
+            payload = {"src": iconify_url(MDI_NAMES.get(icon, icon.lower()))}
+        
+        shapes_items.append({
+            "label": label,
+            "icon": icon,
+            "type": type_,
+            "payload": payload
+        })
+
+    # Add more icon shapes to reach ~50
+    extra_icons = [
+        ("Camera", "Camera", "camera"), ("Video", "Video", "video"), ("Music", "Music", "music-note"),
+        ("Map", "Map", "map-marker"), ("Calendar", "Calendar", "calendar"), ("Clock", "Clock", "clock"),
+        ("Phone", "Phone", "phone"), ("Mail", "Mail", "email"), ("Lock", "Lock", "lock"),
+        ("Unlock", "Unlock", "lock-open"), ("Eye", "Eye", "eye"), ("Eye Off", "EyeOff", "eye-off"),
+        ("Trash", "Trash2", "delete"), ("Edit", "Edit", "pencil"), ("Share", "Share", "share-variant"),
+        ("Download", "Download", "download"), ("Upload", "Upload", "upload"), ("Filter", "Filter", "filter"),
+        ("Sort", "List", "sort"), ("Grid", "Grid", "grid"), ("List", "List", "format-list-bulleted"),
+        ("Menu", "Menu", "menu"), ("More", "MoreHorizontal", "dots-horizontal")
+    ]
+    
+    for label, icon, mdi_name in extra_icons:
+        shapes_items.append({
+            "label": label,
+            "icon": icon,
+            "type": "image",
+            "payload": {"src": iconify_url(mdi_name)}
+        })
+
+    return shapes_items
+
+# --- FRAMES (50) ---
+fixed_frames = [
+    { "label": "Phone", "icon": "Smartphone", "type": "rectangle", "payload": { "width": 180, "height": 320, "borderRadius": 24, "border": "4px solid #333", "backgroundColor": "transparent" } },
+    { "label": "Tablet", "icon": "Tablet", "type": "rectangle", "payload": { "width": 240, "height": 320, "borderRadius": 16, "border": "4px solid #333", "backgroundColor": "transparent" } },
+    { "label": "Browser", "icon": "Layout", "type": "rectangle", "payload": { "width": 300, "height": 200, "borderRadius": 8, "border": "2px solid #ccc", "backgroundColor": "#fff", "boxShadow": "0 4px 6px -1px rgba(0, 0, 0, 0.1)" } },
+    { "label": "Polaroid", "icon": "Image", "type": "rectangle", "payload": { "width": 220, "height": 260, "backgroundColor": "#fff", "padding": "16px 16px 60px 16px", "boxShadow": "0 4px 6px rgba(0,0,0,0.1)" } },
+    { "label": "Circle Frame", "icon": "CircleDashed", "type": "circle", "payload": { "width": 200, "height": 200, "border": "4px solid #333", "backgroundColor": "transparent" } },
+]
+
+border_styles = ["solid", "dashed", "dotted", "double"]
+colors = ["#000", "#333", "#666", "#2563eb", "#dc2626", "#16a34a", "#d97706", "#9333ea"]
+
+def frame(style, color, width, radius):
+    return {
+        "label": f"{style.capitalize()} Frame",
+        "icon": "Layout",
+        "type": "rectangle",
+        "payload": {
+            "width": 200,
+            "height": 200,
+            "border": f"{width}px {style} {color}",
+            "borderRadius": radius,
+            "backgroundColor": "transparent"
+        }
+    }
+
+# --- BUTTONS (150) ---
+btn_texts = ["Buy Now", "Sign Up", "Learn More", "Get Started", "Subscribe", "Join Us", "Shop Now", "Book Now", "Contact Us", "Read More", "Download", "Play", "Watch", "Listen", "Vote"]
+btn_colors = [
+    ("#2563eb", "#fff"), ("#dc2626", "#fff"), ("#16a34a", "#fff"), ("#d97706", "#fff"), 
+    ("#9333ea", "#fff"), ("#000000", "#fff"), ("#fff", "#000"), ("#f43f5e", "#fff"),
+    ("#0ea5e9", "#fff"), ("#8b5cf6", "#fff"), ("#ec4899", "#fff"), ("#14b8a6", "#fff")
+]
+
+def button(text, colors, variant):
+    # An optional third color replaces bg as the Outline text/border color (see palette_axes)
+    bg, fg, *outline = colors
+    if variant == "Outline":
+        line = outline[0] if outline else bg
+        payload = { "content": text, "backgroundColor": "transparent", "color": line, "border": f"2px solid {line}", "borderRadius": 6, "padding": 12, "fontSize": 16, "textAlign": "center", "width": 120, "height": 44, "fontWeight": "600" }
+    else:
+        radius = 999 if variant == "Pill" else 6
+        payload = { "content": text, "backgroundColor": bg, "color": fg, "borderRadius": radius, "padding": 12, "fontSize": 16, "textAlign": "center", "width": 120, "height": 44, "fontWeight": "600" }
+    return {
+        "label": f"{text} {variant}",
+        "previewType": "css",
+        "type": "text",
+        "payload": payload
+    }
+
+# --- BADGES (150) ---
+badge_texts = ["SALE", "NEW", "HOT", "FREE", "PRO", "BETA", "50% OFF", "SOLD OUT", "LIMITED", "TOP", "VIP", "BEST", "10%", "20%", "30%", "40%", "50%", "60%", "70%", "80%", "90%", "100%"]
+badge_colors = ["#dc2626", "#16a34a", "#ea580c", "#2563eb", "#000000", "#7c3aed", "#db2777", "#475569", "#ca8a04", "#0891b2"]
+
+def badge(text, color, pill):
+    return {
+        "label": f"{text} Pill" if pill else text,
+        "previewType": "css",
+        "type": "text",
+        "payload": { "content": text, "backgroundColor": color, "color": "#fff", "borderRadius": 999 if pill else 4, "fontSize": 12, "fontWeight": "bold", "textAlign": "center", "width": "auto", "padding": "4px 8px" }
+    }
+
+# --- TITLES (100) ---
+title_texts = [
+    "BIG SALE", "HUGE SAVINGS", "LIMITED TIME", "DON'T MISS OUT", "FLASH SALE", 
+    "SUMMER VIBES", "WINTER SALE", "SPRING COLLECTION", "AUTUMN LOOK", 
+    "NEW ARRIVALS", "BACK IN STOCK", "TRENDING NOW", "EDITOR'S PICK",
+    "SPECIAL OFFER", "EXCLUSIVE DEAL", "MEMBERS ONLY", "JOIN THE CLUB",
+    "HELLO WORLD", "WELCOME", "GOOD VIBES", "STAY TUNED", "COMING SOON",
+    "GRAND OPENING", "FINAL CLEARANCE", "BEST SELLER", "TOP RATED"
+]
+
+fonts = ["Inter", "Serif", "Monospace", "Cursive", "Fantasy"]
+title_colors = ["#000", "#333", "#2563eb", "#dc2626", "#16a34a", "#d97706", "#9333ea", "#db2777"]
+
+def title(text, color, font):
+    return {
+        "label": text,
+        "previewType": "css",
+        "type": "text",
+        "payload": { 
+            "content": text, 
+            "color": color, 
+            "fontSize": 32, 
+            "fontWeight": "900", 
+            "textAlign": "center",
+            "fontFamily": font,
+            "textTransform": "uppercase"
+        }
+    }
+
+CATEGORIES = [
+    Category("shapes", 50, items=shape_items()),
+    Category("frames", 50, VariantSpace({"style": border_styles, "color": colors, "width": range(2, 9), "radius": [0, 8, 16, 24, 999]}, frame), items=fixed_frames),
+    Category("buttons", 150, VariantSpace({"text": btn_texts, "colors": btn_colors, "variant": ["Flat", "Outline", "Pill"]}, button)),
+    Category("badges", 150, VariantSpace({"text": badge_texts, "color": badge_colors, "pill": [False, True]}, badge)),
+    Category("titles", 100, VariantSpace({"text": title_texts, "color": title_colors, "font": fonts}, title)),
+]
+
+def palette_axes(palette):
+    """Axis overrides that remap every color axis onto a brand palette."""
+    pairs = accessible_pairs(palette, palette + ["#ffffff", "#000000"])
+    # Outline buttons put their color straight on the canvas, so it needs contrast there too
+    outlines = ensure_contrast([bg for bg, _ in pairs], CANVAS)
+    return {
+        # Frame borders and 32px titles sit on the canvas: 3:1 for graphics and large text
+        "frames": {"color": on_canvas(palette)},
+        # Button labels are 16px and badge labels 12px, so both need AA normal-text contrast
+        "buttons": {"colors": [(bg, fg, line) for (bg, fg), line in zip(pairs, outlines)]},
+        "badges": {"color": list(dict.fromkeys(ensure_contrast(palette, "#fff")))},
+        "titles": {"color": on_canvas(palette)},
+    }
+
+def generate_elements(seed=DEFAULT_SEED, cache=False, categories=None):
+    """Build the catalog in its file layout; `categories` limits it to those category names."""
+    return assemble(build_groups(select(CATEGORIES, categories), seed, CATALOG if cache else None), NESTED)
+
+def write_artifacts(args, paths, versions=None, extra=None):
+    try:
+        map_path, assets = publish_outputs(paths, args.out_dir, args.artifact_dir, args.artifact_url, versions, extra)
+    except ArtifactError as e:
+        sys.exit(f"error: {e}")
+    print(f"Published {len(assets)} artifact(s), asset map: {map_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the TemplateBuilder stock elements catalog.")
+    parser.add_argument("--out-dir", default=DATA_DIR, help="directory for the generated files (default: the TemplateBuilder data directory)")
+    parser.add_argument("--shard", action="store_true", help="write one file per category plus a manifest instead of a single JSON file")
+    parser.add_argument("--seed", default=DEFAULT_SEED, help=f"seed for variant sampling (default: {DEFAULT_SEED})")
+    parser.add_argument("--no-cache", action="store_true", help="rebuild every category instead of reusing unchanged ones from .cache/catalog")
+    parser.add_argument("--compact", action="store_true", help="use the dictionary-encoded compact/1 format (see catalog/compact.py)")
+    parser.add_argument("--bundle-icons", choices=["sprite", "inline"], help="resolve shape icons offline into a hashed SVG sprite in --artifact-dir or inline data URIs")
+    parser.add_argument("--icon-collection", default=DEFAULT_COLLECTION, help="Iconify JSON collection for mdi (default: @iconify-json/mdi from node_modules)")
+    parser.add_argument("--search-index", action="store_true", help=f"also write {CATALOG}.index.json, an inverted index for search and category lookups")
+    parser.add_argument("--thumbnails", choices=["webp", "png"], help="pre-render previews into hashed sprite atlases in --artifact-dir (requires Pillow)")
+    parser.add_argument("--minify", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--stream", choices=["ndjson", "chunks"], help="stream items to NDJSON or chunked JSON arrays with constant memory")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="records per file with --stream chunks (default: 10000)")
+    parser.add_argument("--patch-from", metavar="PREVIOUS", help="also write a delta patch from this previous build (any layout) to the new one")
+    parser.add_argument("--artifacts", action="store_true", help=f"also publish content-hashed .json/.gz/.br copies and update <out-dir>/{ASSET_MAP} (requires brotli)")
+    parser.add_argument("--artifact-dir", default=ARTIFACT_DIR, help="where hashed files (--artifacts, --thumbnails, the icon sprite) are written (default: public/catalog)")
+    parser.add_argument("--artifact-url", default=ARTIFACT_URL, help=f"URL prefix the hashed files are served under (default: {ARTIFACT_URL})")
+    args = parser.parse_args()
+
+    if args.stream:
+        if args.shard or args.compact or args.thumbnails or args.search_index or args.patch_from or args.bundle_icons:
+            parser.error("--stream writes items as they are generated and can't be combined with whole-catalog stages")
+        path = write_stream(CATALOG, CATEGORIES, args.seed, args.out_dir, args.stream, args.chunk_size, None if args.minify else 2)
+        print(f"Streamed {CATALOG} to {path}")
+        if args.artifacts:
+            write_artifacts(args, [path])
+        return
+
+    groups = build_groups(CATEGORIES, args.seed, None if args.no_cache else CATALOG)
+    # Files the items link to (sprite, atlases), published to the artifact directory before the catalog
+    published = {}
+    if args.bundle_icons:
+        try:
+            sprite = bundle_icons(groups, args.bundle_icons, IconCollection(args.icon_collection),
+                                  args.artifact_dir, args.artifact_url)
+        except UnresolvedIconError as e:
+            sys.exit(f"error: {e}")
+        published.update(sprite)
+        for entry in sprite.values():
+            print(f"Bundled shape icons into {entry['url']}")
+    if args.thumbnails:
+        try:
+            atlases = build_atlas(groups, CATALOG, args.thumbnails, args.artifact_dir, args.artifact_url)
+        except ThumbnailError as e:
+            sys.exit(f"error: {e}")
+        published.update(atlases)
+        print(f"Rendered thumbnails into {len(atlases)} atlas page(s) in {args.artifact_dir}")
+    outputs = []
+    if args.search_index:
+        outputs.append(write_index(groups, CATALOG, args.out_dir))
+    if args.patch_from:
+        try:
+            path, patch = write_patch(load_records(args.patch_from), records(groups), args.out_dir, CATALOG)
+        except ValueError as e:
+            sys.exit(f"error: {e}")
+        outputs.append(path)
+        print(f"Wrote {path}: {summary(patch)}")
+    # The hash patches use as "from"/"to", published so clients can find their patch
+    version = records_hash(records(groups))
+    output_path = write_catalog(CATALOG, groups, args.out_dir, NESTED, shard=args.shard, compact=args.compact, indent=None if args.minify else 2)
+
+    print(f"Successfully wrote {sum(len(items) for _, items in groups)} elements to {output_path}, version {version}")
+    if args.artifacts:
+        write_artifacts(args, [output_path] + outputs, {os.path.basename(output_path): version}, published)
+    elif published:
+        write_asset_map(published, os.path.join(args.out_dir, ASSET_MAP))
+
+if __name__ == "__main__":
+    main()
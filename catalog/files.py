@@ -0,0 +1,50 @@
+import contextlib
+import os
+import tempfile
+
+
+@contextlib.contextmanager
+def open_atomic(path, mode="wb"):
+    """Open a temp file next to `path` that replaces it only if the block succeeds.
+
+    Readers never observe a half-written file, even when the output is streamed.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; give the result the usual umask-derived mode
+        os.chmod(tmp_path, 0o666 & ~_umask())
+        with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_file(path, data):
+    """Atomically write `data` (str or bytes) to `path` unless it already holds it.
+
+    Returns True when the file was (re)written.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open_atomic(path) as f:
+        f.write(data)
+    return True
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
@@ -0,0 +1,161 @@
+"""Offline resolution of mdi shape icons into a local SVG sprite.
+
+Icons are resolved against the Iconify JSON collection for Material Design
+Icons (the `@iconify-json/mdi` npm package) instead of being fetched from
+api.iconify.design at runtime. Resolved icons are cached per icon under
+.cache/catalog/icons so repeat builds don't re-parse the collection.
+"""
+import hashlib
+import json
+import os
+import re
+from urllib.parse import quote
+
+from catalog import ROOT_DIR
+from catalog.artifacts import ARTIFACT_DIR, ARTIFACT_URL, publish_data
+from catalog.cache import CACHE_DIR
+from catalog.files import write_file
+
+PREFIX = "mdi"
+COLOR = "#666"
+DEFAULT_COLLECTION = os.path.join(ROOT_DIR, "node_modules", "@iconify-json", "mdi", "icons.json")
+SPRITE_NAME = "mdi-sprite.svg"
+
+ICONIFY_URL = re.compile(r"^https://api\.iconify\.design/mdi:([a-z0-9-]+)\.svg")
+
+
+class UnresolvedIconError(Exception):
+    pass
+
+
+def iconify_url(name):
+    return f"https://api.iconify.design/{PREFIX}:{name}.svg?color=%23666"
+
+
+class IconCollection:
+    def __init__(self, path=DEFAULT_COLLECTION, cache_dir=CACHE_DIR):
+        self.path = path
+        self._data = None
+        # Keyed on the collection file's identity so upgrading the package invalidates it
+        stat = os.stat(path) if os.path.exists(path) else None
+        key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}" if stat else path
+        self.cache_dir = os.path.join(cache_dir, "icons", hashlib.sha1(key.encode()).hexdigest()[:12])
+
+    def _collection(self):
+        if self._data is None:
+            if not os.path.exists(self.path):
+                raise UnresolvedIconError(
+                    f"Icon collection not found at {self.path} (install @iconify-json/mdi or pass --icon-collection)")
+            with open(self.path, encoding="utf-8") as f:
+                self._data = json.load(f)
+        return self._data
+
+    def resolve(self, name):
+        """Return {"body", "width", "height"} for an icon name, following aliases."""
+        cache_path = os.path.join(self.cache_dir, f"{name}.json")
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+
+        data = self._collection()
+        icons = data.get("icons", {})
+        aliases = data.get("aliases", {})
+        transforms = []
+        current = name
+        while current not in icons:
+            alias = aliases.get(current)
+            if alias is None or len(transforms) > 8:
+                return None
+            transforms.append(alias)
+            current = alias["parent"]
+
+        icon = icons[current]
+        width = icon.get("width", data.get("width", 24))
+        height = icon.get("height", data.get("height", 24))
+        body = icon["body"]
+        # Apply alias transformations innermost (closest to the parent) first
+        for alias in reversed(transforms):
+            body = _transform(body, alias, width, height)
+
+        resolved = {"body": body, "width": width, "height": height}
+        write_file(cache_path, json.dumps(resolved))
+        return resolved
+
+
+def _transform(body, alias, width, height):
+    parts = []
+    if alias.get("rotate"):
+        parts.append(f"rotate({alias['rotate'] * 90} {width / 2} {height / 2})")
+    if alias.get("hFlip"):
+        parts.append(f"translate({width} 0) scale(-1 1)")
+    if alias.get("vFlip"):
+        parts.append(f"translate(0 {height}) scale(1 -1)")
+    if not parts:
+        return body
+    return f'<g transform="{" ".join(parts)}">{body}</g>'
+
+
+def _svg(icon):
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{icon["width"]}" height="{icon["height"]}" '
+            f'viewBox="0 0 {icon["width"]} {icon["height"]}" style="color:{COLOR}">{icon["body"]}</svg>')
+
+
+def _sprite(icons):
+    # Icons are stacked vertically; each <view> crops the sprite to one icon, so
+    # "<sprite>.svg#mdi-camera" works directly as an <img> src
+    parts = []
+    y = 0
+    width = max((icon["width"] for icon in icons.values()), default=24)
+    for name, icon in icons.items():
+        w, h = icon["width"], icon["height"]
+        parts.append(f'<view id="{PREFIX}-{name}" viewBox="0 {y} {w} {h}"/>')
+        parts.append(f'<svg y="{y}" width="{w}" height="{h}" viewBox="0 0 {w} {h}">{icon["body"]}</svg>')
+        y += h
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{y}" '
+            f'viewBox="0 0 {width} {y}" style="color:{COLOR}">{"".join(parts)}</svg>')
+
+
+def bundle_icons(groups, mode="sprite", collection=None, out_dir=ARTIFACT_DIR, base_url=ARTIFACT_URL):
+    """Rewrite every api.iconify.design mdi `payload.src` in `groups` to a local icon.
+
+    mode="sprite" publishes one content-hashed SVG sprite to `out_dir` (see
+    artifacts.publish_data) and points each item at `<sprite url>#mdi-<name>`;
+    it returns the sprite's asset map entries. mode="inline" embeds each icon
+    as a data URI and returns an empty dict. Raises UnresolvedIconError
+    listing every icon that can't be resolved.
+    """
+    collection = collection or IconCollection()
+    targets = []
+    for _, items in groups:
+        for item in items:
+            match = ICONIFY_URL.match(item.get("payload", {}).get("src", ""))
+            if match:
+                targets.append((item, match.group(1)))
+
+    icons = {}
+    missing = []
+    for _, name in targets:
+        if name in icons or name in missing:
+            continue
+        icon = collection.resolve(name)
+        if icon is None:
+            missing.append(name)
+        else:
+            icons[name] = icon
+    if missing:
+        raise UnresolvedIconError(f"Unresolved {PREFIX} icons: {', '.join(sorted(missing))}")
+
+    if mode == "inline":
+        for item, name in targets:
+            item["payload"]["src"] = "data:image/svg+xml," + quote(_svg(icons[name]))
+        return {}
+    if not targets:
+        return {}
+
+    sprite = _sprite(dict(sorted(icons.items())))
+    entry = publish_data(SPRITE_NAME, sprite.encode("utf-8"), out_dir, base_url)
+    for item, name in targets:
+        item["payload"]["src"] = f"{entry['url']}#{PREFIX}-{name}"
+    return {SPRITE_NAME: entry}
@@ -0,0 +1,54 @@
+import json
+import os
+
+from catalog.compact import encode
+from catalog.delta import records_hash
+from catalog.files import write_file
+from catalog.shards import write_shards
+from catalog.stream import stream_records, write_chunks, write_ndjson
+
+
+def records(groups):
+    """Flatten (category, items) groups into records that carry their category."""
+    return [
+        item if "category" in item else {"category": category, **item}
+        for category, items in groups
+        for item in items
+    ]
+
+
+def assemble(groups, nested):
+    # stockElements.json nests items under their category; textStyles.json is flat
+    if nested:
+        return [{"category": category, "items": items} for category, items in groups]
+    return records(groups)
+
+
+def write_catalog(catalog, groups, out_dir, nested, shard=False, compact=False, filename=None, indent=2):
+    """Write a built catalog in the requested layout and return the path written.
+
+    `indent=None` writes the plain JSON layout without whitespace.
+    """
+    if shard:
+        path = os.path.join(out_dir, catalog)
+        write_shards(groups, path, catalog, compact=compact, version=records_hash(records(groups)))
+    elif compact:
+        path = os.path.join(out_dir, filename or f"{catalog}.compact.json")
+        write_file(path, json.dumps(encode(records(groups)), separators=(",", ":"), ensure_ascii=False))
+    else:
+        path = os.path.join(out_dir, filename or f"{catalog}.json")
+        separators = None if indent else (",", ":")
+        write_file(path, json.dumps(assemble(groups, nested), indent=indent, separators=separators))
+    return path
+
+
+def write_stream(catalog, categories, seed, out_dir, layout, chunk_size=10000, indent=None):
+    """Stream a catalog straight from its category definitions; returns the path written."""
+    records = stream_records(categories, seed)
+    if layout == "ndjson":
+        path = os.path.join(out_dir, f"{catalog}.ndjson")
+        write_ndjson(path, records)
+    else:
+        path = os.path.join(out_dir, f"{catalog}-chunks")
+        write_chunks(path, catalog, records, chunk_size, indent)
+    return path
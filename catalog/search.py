@@ -0,0 +1,75 @@
+"""Precomputed inverted index over a built catalog.
+
+Layout of <catalog>.index.json:
+
+    {
+      "version": 1,
+      "count": 465,
+      "categories": {"Headlines": [0, 50], "Sale": [50, 50], ...},
+      "terms": {"category:sale": [50, 51, ...], "color:#ef4444": [...], "label:deal": [...], ...}
+    }
+
+Item IDs are positions in the flattened catalog (category order, then item
+order), i.e. the index into textStyles.json, or into the concatenated
+`items` arrays of stockElements.json. `categories` maps each category to its
+[offset, count] range. Terms are "<field>:<token>" keys in sorted order, so
+prefix search is a binary search over the keys; posting lists are sorted.
+"""
+import json
+import os
+import re
+
+from catalog.files import write_file
+
+VERSION = 1
+TOKEN = re.compile(r"[a-z0-9]+")
+COLOR = re.compile(r"#[0-9a-fA-F]{3,8}\b|rgba?\([^)]*\)")
+
+
+def _color(value):
+    value = value.lower().replace(" ", "")
+    if re.fullmatch(r"#[0-9a-f]{3}", value):
+        value = "#" + "".join(c * 2 for c in value[1:])
+    return value
+
+
+def item_terms(category, item):
+    terms = {f"category:{token}" for token in TOKEN.findall(category.lower())}
+    terms.update(f"label:{token}" for token in TOKEN.findall(item.get("label", "").lower()))
+    if item.get("type"):
+        terms.add(f"type:{item['type']}")
+    style = item.get("style") or item.get("payload") or {}
+    for key, value in style.items():
+        if not isinstance(value, str):
+            continue
+        if key == "fontFamily":
+            family = value.split(",")[0].strip().strip("'\"").lower()
+            terms.add(f"font:{family}")
+        elif key != "src":
+            terms.update(f"color:{_color(color)}" for color in COLOR.findall(value))
+    return terms
+
+
+def build_index(groups):
+    categories = {}
+    postings = {}
+    item_id = 0
+    for category, items in groups:
+        categories[category] = [item_id, len(items)]
+        for item in items:
+            for term in item_terms(category, item):
+                postings.setdefault(term, []).append(item_id)
+            item_id += 1
+    # IDs are assigned in increasing order, so posting lists are already sorted
+    return {
+        "version": VERSION,
+        "count": item_id,
+        "categories": categories,
+        "terms": dict(sorted(postings.items())),
+    }
+
+
+def write_index(groups, catalog, out_dir):
+    path = os.path.join(out_dir, f"{catalog}.index.json")
+    write_file(path, json.dumps(build_index(groups), separators=(",", ":"), ensure_ascii=False))
+    return path
@@ -0,0 +1,178 @@
+"""On-demand brand-themed catalogs over HTTP.
+
+    python -m catalog.serve --port 8787 --cache-mb 64
+
+    GET /catalogs/textStyles.json?palette=0f172a,e11d48,f59e0b&seed=0
+    GET /catalogs/stockElements.json?palette=...
+
+Every color axis is remapped onto the palette (palette order matters). Built
+catalogs are kept in a size-bounded LRU keyed by catalog, palette hash, seed
+and GENERATOR_VERSION. The strong ETag is a hash of the body. The cache
+remembers the ETag of each key it has built even after the body is evicted,
+so a matching If-None-Match gets a 304 without a rebuild. After a restart
+the catalog is rebuilt once and the request still gets a 304 if the body
+did not change.
+"""
+import argparse
+import hashlib
+import json
+import threading
+import traceback
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from catalog import DEFAULT_SEED, GENERATOR_VERSION
+from catalog.build import GENERATORS, build_groups, generator, variant_categories
+from catalog.colors import normalize_hex
+from catalog.output import assemble
+
+MAX_PALETTE = 32
+MAX_ETAGS = 100_000
+
+
+class LRUCache:
+    """Thread-safe LRU bounded by the total size of the cached bodies.
+
+    ETags are kept separately, up to `max_etags` of them, so a key can still be
+    revalidated after its body was evicted.
+    """
+
+    def __init__(self, max_bytes, max_etags=MAX_ETAGS):
+        self.max_bytes = max_bytes
+        self.max_etags = max_etags
+        self.size = 0
+        self._entries = OrderedDict()
+        self._etags = OrderedDict()
+        self._lock = threading.Lock()
+
+    def etag(self, key):
+        with self._lock:
+            etag = self._etags.get(key)
+            if etag is not None:
+                self._etags.move_to_end(key)
+            return etag
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, etag, body):
+        with self._lock:
+            self._etags[key] = etag
+            self._etags.move_to_end(key)
+            if len(self._etags) > self.max_etags:
+                self._etags.popitem(last=False)
+            if len(body) > self.max_bytes:
+                return
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key)[1])
+            self._entries[key] = (etag, body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+def parse_palette(value):
+    colors = [normalize_hex(c) for c in value.split(",") if c.strip()]
+    if not colors or len(colors) > MAX_PALETTE:
+        raise ValueError(f"palette must have 1-{MAX_PALETTE} colors")
+    return colors
+
+
+def cache_key(catalog, palette, seed):
+    palette_hash = hashlib.sha256(",".join(palette).encode()).hexdigest()
+    return (catalog, palette_hash, str(seed), GENERATOR_VERSION)
+
+
+def etag_for(body):
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(header, etag):
+    """Weak comparison, as If-None-Match requires: W/ prefixes are ignored."""
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+def build_themed(catalog, palette, seed):
+    spec = {"name": "tenant", "palette": palette, "seed": seed}
+    groups = build_groups(variant_categories(spec, catalog), seed)
+    return json.dumps(assemble(groups, generator(catalog).NESTED), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def make_handler(cache):
+    class CatalogHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            name = url.path.removeprefix("/catalogs/").removesuffix(".json")
+            if not url.path.startswith("/catalogs/") or name not in GENERATORS:
+                return self._send(404, b'{"error":"unknown catalog"}')
+
+            query = parse_qs(url.query)
+            try:
+                palette = parse_palette(query.get("palette", [""])[0])
+            except ValueError as e:
+                return self._send(400, json.dumps({"error": str(e)}).encode())
+            seed = query.get("seed", [str(DEFAULT_SEED)])[0]
+
+            key = cache_key(name, palette, seed)
+            if_none_match = self.headers.get("If-None-Match", "")
+            etag = cache.etag(key)
+            if etag is not None and etag_matches(if_none_match, etag):
+                return self._send(304, None, etag)
+
+            entry = cache.get(key)
+            if entry is None:
+                try:
+                    body = build_themed(name, palette, seed)
+                except Exception:
+                    traceback.print_exc()
+                    return self._send(500, b'{"error":"catalog build failed"}')
+                entry = (etag_for(body), body)
+                cache.put(key, *entry)
+            etag, body = entry
+            if etag_matches(if_none_match, etag):
+                return self._send(304, None, etag)
+            self._send(200, body, etag)
+
+        def _send(self, status, body, etag=None):
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+                # Tenant-specific: only the browser may cache, and it must revalidate
+                self.send_header("Cache-Control", "private, no-cache")
+            if body is not None:
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body is not None:
+                self.wfile.write(body)
+
+    return CatalogHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve brand-themed catalogs with an LRU cache and ETags.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--cache-mb", type=float, default=64, help="LRU budget for built catalogs (default: 64)")
+    args = parser.parse_args()
+
+    cache = LRUCache(int(args.cache_mb * 1024 * 1024))
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(cache))
+    print(f"Serving catalogs on http://{args.host}:{args.port}/catalogs/<name>.json?palette=...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import hashlib
+import json
+import os
+import re
+
+from catalog.compact import FORMAT, encode
+from catalog.files import write_file
+
+
+def slugify(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def write_shards(groups, out_dir, catalog, compact=False, version=None):
+    """Write one JSON file per category plus a manifest.json describing them.
+
+    `groups` is a list of (category, items) pairs in display order. With
+    `compact`, each shard is written in the catalog.compact encoding instead
+    of as a plain item list. `version` (delta.records_hash of the flat
+    records) is recorded in the manifest, so clients know which patch applies.
+    """
+    categories = []
+    for category, items in groups:
+        payload = encode(items) if compact else items
+        data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        filename = f"{slugify(category)}.json"
+        write_file(os.path.join(out_dir, filename), data)
+        categories.append({
+            "category": category,
+            "file": filename,
+            "count": len(items),
+            "bytes": len(data),
+            "hash": hashlib.sha256(data).hexdigest()[:16],
+        })
+
+    manifest = {
+        "catalog": catalog,
+        "format": FORMAT if compact else "json",
+        "count": sum(c["count"] for c in categories),
+        "categories": categories,
+    }
+    if version is not None:
+        manifest["version"] = version
+    write_file(os.path.join(out_dir, "manifest.json"), json.dumps(manifest, indent=2))
+    return manifest
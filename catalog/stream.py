@@ -0,0 +1,76 @@
+"""Streaming catalog writers for very large (per-tenant) catalogs.
+
+Items are pulled one at a time from stream_category() and written as they
+are produced, so peak memory does not depend on the item count:
+
+- NDJSON: one flat record (with its "category") per line.
+- Chunked JSON: arrays of at most `chunk_size` records in numbered files plus
+  a manifest.json, so clients can page through the catalog.
+"""
+import json
+import os
+import re
+
+from catalog.files import open_atomic, write_file
+from catalog.variants import stream_category
+
+
+def stream_records(categories, seed):
+    for category in categories:
+        for item in stream_category(category, seed):
+            yield item if "category" in item else {"category": category.name, **item}
+
+
+def _dumps(record, indent):
+    if indent:
+        return json.dumps(record, indent=indent, ensure_ascii=False)
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_ndjson(path, records):
+    count = 0
+    with open_atomic(path, "w") as f:
+        for record in records:
+            f.write(_dumps(record, None))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_chunks(out_dir, catalog, records, chunk_size=10000, indent=None):
+    """Write `records` as numbered chunk files plus a manifest; returns the manifest.
+
+    Chunk files left over from an earlier, longer run are removed.
+    """
+    chunks = []
+    records = iter(records)
+    exhausted = False
+    while not exhausted:
+        filename = f"{catalog}-{len(chunks):05d}.json"
+        count = 0
+        with open_atomic(os.path.join(out_dir, filename), "w") as f:
+            f.write("[")
+            for record in records:
+                if count:
+                    f.write(",")
+                f.write(_dumps(record, indent))
+                count += 1
+                if count == chunk_size:
+                    break
+            else:
+                exhausted = True
+            f.write("]")
+        if count == 0:
+            # The previous chunk ended exactly at the last record
+            os.unlink(os.path.join(out_dir, filename))
+            break
+        chunks.append({"file": filename, "count": count})
+
+    manifest = {"catalog": catalog, "count": sum(c["count"] for c in chunks), "chunks": chunks}
+    write_file(os.path.join(out_dir, "manifest.json"), json.dumps(manifest, indent=2))
+    current = {chunk["file"] for chunk in chunks}
+    pattern = re.compile(rf"{re.escape(catalog)}-\d{{5}}\.json")
+    for filename in os.listdir(out_dir):
+        if pattern.fullmatch(filename) and filename not in current:
+            os.unlink(os.path.join(out_dir, filename))
+    return manifest
@@ -0,0 +1,11 @@
+import pytest
+
+from catalog import DEFAULT_SEED
+from catalog.build import GENERATORS, build_groups, generator
+from catalog.output import records
+
+
+@pytest.fixture(scope="session", params=sorted(GENERATORS))
+def catalog_records(request):
+    """Flat records of a freshly built catalog (without the build cache)."""
+    return records(build_groups(generator(request.param).CATEGORIES, DEFAULT_SEED))
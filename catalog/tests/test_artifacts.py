@@ -0,0 +1,104 @@
+import gzip
+import json
+
+import pytest
+
+from catalog.artifacts import hashed_name, publish, publish_data, write_asset_map
+from catalog.icons import IconCollection, bundle_icons, iconify_url
+
+
+def asset(url):
+    return {"url": url, "bytes": 1, "gzip": 1, "br": 1}
+
+
+def test_asset_map_merges_other_catalogs(tmp_path):
+    path = tmp_path / "catalog-assets.json"
+    write_asset_map({"textStyles.json": asset("/catalog/textStyles.a.json")}, path)
+    merged = write_asset_map({"stockElements.json": asset("/catalog/stockElements.b.json")}, path)
+    assert set(merged) == {"textStyles.json", "stockElements.json"}
+    assert json.loads(path.read_text(encoding="utf-8")) == merged
+
+    merged = write_asset_map({"textStyles.json": asset("/catalog/textStyles.c.json")}, path)
+    assert merged["textStyles.json"]["url"] == "/catalog/textStyles.c.json"
+    assert merged["stockElements.json"]["url"] == "/catalog/stockElements.b.json"
+
+
+def test_asset_map_drops_stale_shards(tmp_path):
+    path = tmp_path / "catalog-assets.json"
+    write_asset_map({
+        "stockElements/manifest.json": asset("/m1"),
+        "stockElements/shapes.json": asset("/s1"),
+        "stockElements/old.json": asset("/o1"),
+        "textStyles/headlines.json": asset("/h1"),
+        "textStyles.index.json": asset("/i1"),
+    }, path)
+    merged = write_asset_map({
+        "stockElements/manifest.json": asset("/m2"),
+        "stockElements/shapes.json": asset("/s2"),
+    }, path)
+    assert merged == {
+        "stockElements/manifest.json": asset("/m2"),
+        "stockElements/shapes.json": asset("/s2"),
+        "textStyles/headlines.json": asset("/h1"),
+        "textStyles.index.json": asset("/i1"),
+    }
+
+
+def test_publish_hashes_and_precompresses(tmp_path):
+    pytest.importorskip("brotli")
+    source = tmp_path / "data" / "textStyles.json"
+    source.parent.mkdir()
+    source.write_text('[{"label": "“Quote”"}]', encoding="utf-8")
+    out_dir = tmp_path / "public"
+    assets = publish([source], out_dir, "https://cdn.example.com/catalog/", {"textStyles.json": "abc"})
+
+    data = source.read_bytes()
+    name = hashed_name("textStyles.json", data)
+    assert assets == {"textStyles.json": {
+        "url": f"https://cdn.example.com/catalog/{name}",
+        "bytes": len(data),
+        "gzip": (out_dir / f"{name}.gz").stat().st_size,
+        "br": (out_dir / f"{name}.br").stat().st_size,
+        "version": "abc",
+    }}
+    assert (out_dir / name).read_bytes() == data
+    assert gzip.decompress((out_dir / f"{name}.gz").read_bytes()) == data
+
+
+def test_publish_rewrites_shard_manifests(tmp_path):
+    pytest.importorskip("brotli")
+    shards = tmp_path / "stockElements"
+    shards.mkdir()
+    (shards / "shapes.json").write_text("[]", encoding="utf-8")
+    manifest = {"catalog": "stockElements", "categories": [{"category": "shapes", "file": "shapes.json"}], "version": "v1"}
+    (shards / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    assets = publish([shards], tmp_path / "public", "/catalog")
+    shard_name = hashed_name("shapes.json", b"[]")
+    assert assets["stockElements/shapes.json"]["url"] == f"/catalog/stockElements/{shard_name}"
+    assert assets["stockElements/manifest.json"]["version"] == "v1"
+    published = tmp_path / "public" / "stockElements"
+    [manifest_file] = published.glob("manifest.*.json")
+    assert json.loads(manifest_file.read_text(encoding="utf-8"))["categories"][0]["file"] == shard_name
+
+
+def test_publish_data_skips_compression_for_images(tmp_path):
+    entry = publish_data("cat-atlas-0.webp", b"RIFF....WEBP", tmp_path, "/catalog", compress=False)
+    name = hashed_name("cat-atlas-0.webp", b"RIFF....WEBP")
+    assert entry == {"url": f"/catalog/{name}", "bytes": 12}
+    assert [p.name for p in tmp_path.iterdir()] == [name]
+
+
+def test_sprite_is_published_as_an_artifact(tmp_path):
+    collection = tmp_path / "icons.json"
+    collection.write_text(json.dumps({"prefix": "mdi", "width": 24, "height": 24,
+                                      "icons": {"star": {"body": '<path d="M0 0h24v24H0z"/>'}}}), encoding="utf-8")
+    groups = [("shapes", [{"label": "Star", "payload": {"src": iconify_url("star")}}])]
+    assets = bundle_icons(groups, "sprite", IconCollection(str(collection), tmp_path / "cache"), tmp_path / "public", "https://cdn.example.com/c")
+    [(name, entry)] = assets.items()
+    assert name == "mdi-sprite.svg"
+    assert entry["url"].startswith("https://cdn.example.com/c/mdi-sprite.")
+    assert groups[0][1][0]["payload"]["src"] == f"{entry['url']}#mdi-star"
+    published = tmp_path / "public" / entry["url"].rsplit("/", 1)[1]
+    assert published.read_bytes().startswith(b"<svg")
+    assert gzip.decompress((tmp_path / "public" / f"{published.name}.gz").read_bytes()) == published.read_bytes()
@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from catalog import ROOT_DIR
+from catalog.build import build_variants, generator
+from catalog.output import write_catalog
+
+SPECS = [
+    {"name": "default"},
+    {"name": "small", "seed": 7, "scale": 0.5, "counts": {"buttons": 20}},
+    {"name": "fr", "catalogs": ["textStyles"], "axes": {"Headlines": {"text": ["DERNIÈRE MINUTE", "EXCLUSIF"]}}},
+]
+THEMED = [
+    {"name": "brand", "palette": ["#0f172a", "#e11d48", "#f59e0b"]},
+    {"name": "white", "palette": ["#ffffff"], "catalogs": ["stockElements"]},
+]
+
+
+def written(built, out_dir, **layout):
+    """Write every built catalog under `out_dir`; returns {relative path: bytes}."""
+    for name, catalogs in built.items():
+        for catalog, groups in catalogs.items():
+            write_catalog(catalog, groups, os.path.join(out_dir, name), generator(catalog).NESTED, **layout)
+    files = {}
+    for root, _, names in os.walk(out_dir):
+        for filename in names:
+            path = os.path.join(root, filename)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, out_dir)] = f.read()
+    return files
+
+
+def assert_parallel_matches_serial(specs, tmp_path, **layout):
+    serial = written(build_variants(specs, jobs=1, cache=False), tmp_path / "serial", **layout)
+    parallel = written(build_variants(specs, jobs=2, cache=False), tmp_path / "parallel", **layout)
+    assert serial
+    assert parallel == serial
+
+
+@pytest.mark.parametrize("layout", [{}, {"shard": True}, {"compact": True}])
+def test_parallel_build_is_byte_identical(tmp_path, layout):
+    assert_parallel_matches_serial(SPECS, tmp_path, **layout)
+
+
+def test_parallel_themed_build_is_byte_identical(tmp_path):
+    pytest.importorskip("numpy")
+    assert_parallel_matches_serial(THEMED, tmp_path)
+
+
+def test_specs_are_read_as_utf8(tmp_path):
+    specs = tmp_path / "variants.json"
+    specs.write_text(json.dumps([SPECS[2]], ensure_ascii=False), encoding="utf-8")
+    out_dir = tmp_path / "out"
+    subprocess.run([sys.executable, "-m", "catalog.build", str(specs), "--out-dir", str(out_dir), "--jobs", "1", "--no-cache"],
+                   check=True, capture_output=True, cwd=ROOT_DIR, env={**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUTF8": "0", "LC_ALL": "C"})
+    items = json.loads((out_dir / "fr" / "textStyles.json").read_text(encoding="utf-8"))
+    assert "DERNIÈRE MINUTE" in {item["preview"] for item in items if item["category"] == "Headlines"}
+
+
+@pytest.mark.parametrize("flag", ["--shard", "--compact"])
+def test_stream_rejects_whole_catalog_layouts(tmp_path, flag):
+    specs = tmp_path / "variants.json"
+    specs.write_text(json.dumps(SPECS), encoding="utf-8")
+    result = subprocess.run([sys.executable, "-m", "catalog.build", str(specs), "--out-dir", str(tmp_path / "out"), "--stream", "ndjson", flag],
+                            capture_output=True, text=True, cwd=ROOT_DIR)
+    assert result.returncode == 2
+    assert "--stream" in result.stderr
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from catalog import DEFAULT_SEED
+from catalog.cache import build_cached, category_fingerprint
+from catalog.files import open_atomic, write_file
+from catalog.text_styles import CATEGORIES
+from catalog.variants import with_overrides
+
+QUOTE = next(category for category in CATEGORIES if category.name == "Quote")
+
+
+def test_hit_after_build(tmp_path):
+    items, rebuilt = build_cached(QUOTE, DEFAULT_SEED, "textStyles", tmp_path)
+    assert rebuilt
+    cached, rebuilt = build_cached(QUOTE, DEFAULT_SEED, "textStyles", tmp_path)
+    assert not rebuilt
+    # Quote texts use curly quotes, so this also checks the cache reads back as UTF-8
+    assert cached == items
+
+
+def test_miss_when_the_fingerprint_changes(tmp_path):
+    build_cached(QUOTE, DEFAULT_SEED, "textStyles", tmp_path)
+    assert build_cached(QUOTE, "other", "textStyles", tmp_path)[1]
+    smaller = with_overrides(QUOTE, count=5)
+    assert category_fingerprint(smaller, DEFAULT_SEED) != category_fingerprint(QUOTE, DEFAULT_SEED)
+    items, rebuilt = build_cached(smaller, DEFAULT_SEED, "textStyles", tmp_path)
+    assert rebuilt and len(items) == 5
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path):
+    build_cached(QUOTE, DEFAULT_SEED, "textStyles", tmp_path)
+    [path] = (tmp_path / "textStyles").iterdir()
+    path.write_text("{not json", encoding="utf-8")
+    assert build_cached(QUOTE, DEFAULT_SEED, "textStyles", tmp_path)[1]
+
+
+def test_atomic_write_leaves_no_temp_file_on_error(tmp_path):
+    path = tmp_path / "out.json"
+    write_file(path, "old")
+    with pytest.raises(RuntimeError):
+        with open_atomic(path, "w") as f:
+            f.write("half")
+            raise RuntimeError("interrupted")
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["out.json"]
+
+
+def test_write_file_skips_identical_content(tmp_path):
+    path = tmp_path / "out.json"
+    assert write_file(path, "data")
+    assert not write_file(path, b"data")
+    assert write_file(path, "changed")
@@ -0,0 +1,37 @@
+import pytest
+
+from catalog.canonical import canonicalize, color, length, shadow, tokens
+
+
+def test_built_items_are_canonical(catalog_records):
+    for item in catalog_records:
+        assert canonicalize(item) == item
+
+
+def test_canonicalize_is_idempotent(catalog_records):
+    for item in catalog_records:
+        once = canonicalize(item)
+        assert canonicalize(once) == once
+
+
+@pytest.mark.parametrize("convert, value, expected", [
+    (color, "#FFF", "#ffffff"),
+    (color, "rgb(255, 0, 0)", "#ff0000"),
+    (color, "rgba(0, 0, 0, 0.5)", "rgba(0,0,0,0.5)"),
+    (color, "Transparent", "transparent"),
+    (length, "10px", 10),
+    (length, "8px 4px 8px 4px", "8px 4px"),
+    (length, "0px 0px", 0),
+    (tokens, "2px solid #FFF", "2px solid #ffffff"),
+    (shadow, "0 0 10px rgba(0, 0, 0, 0.5),2px 2px 0px #000", "0 0 10px rgba(0,0,0,0.5), 2px 2px 0 #000000"),
+])
+def test_values_are_idempotent(convert, value, expected):
+    assert convert(value) == expected
+    assert convert(expected) == expected
+
+
+def test_unknown_properties_fail():
+    with pytest.raises(ValueError):
+        canonicalize({"label": "x", "style": {"colour": "#fff"}})
+    with pytest.raises(ValueError):
+        canonicalize({"label": "x", "styles": {}})
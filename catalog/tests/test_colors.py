@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from catalog import elements, text_styles
+from catalog.colors import AA_LARGE, AA_NORMAL, CANVAS, accessible_pairs, contrast_matrix, ensure_contrast, on_canvas
+
+PALETTES = [
+    ["#ffffff"],
+    ["#000000"],
+    ["#777777"],
+    ["#ffffff", "#fde047", "#1e3a8a"],
+    ["#0f172a", "#e11d48", "#f59e0b"],
+    ["#2563eb", "#16a34a", "#f5f5f4", "#a3a3a3"],
+]
+
+
+def ratios(foregrounds, backgrounds):
+    """Pairwise ratio of foregrounds[i] against backgrounds[i]."""
+    return [contrast_matrix([fg], [bg])[0, 0] for fg, bg in zip(foregrounds, backgrounds)]
+
+
+@pytest.mark.parametrize("palette", PALETTES)
+@pytest.mark.parametrize("text", ["#ffffff", "#000000", "#777777", "#fde047"])
+@pytest.mark.parametrize("min_ratio", [AA_LARGE, AA_NORMAL])
+def test_ensure_contrast_meets_the_ratio(palette, text, min_ratio):
+    adjusted = ensure_contrast(palette, text, min_ratio)
+    assert min(ratios([text] * len(palette), adjusted)) >= min_ratio
+
+
+def test_white_on_white():
+    [adjusted] = ensure_contrast(["#ffffff"], "#ffffff", AA_LARGE)
+    assert adjusted != "#ffffff"
+    assert ratios(["#ffffff"], [adjusted])[0] >= AA_LARGE
+
+
+def test_passing_colors_are_unchanged():
+    assert ensure_contrast(["#000000", "#1e3a8a"], "#ffffff") == ["#000000", "#1e3a8a"]
+
+
+def test_unreachable_ratio_raises():
+    # Mid grey text reaches at most ~4.6:1 against black or white
+    with pytest.raises(ValueError):
+        ensure_contrast(["#777777"], "#777777", 7)
+
+
+@pytest.mark.parametrize("palette", PALETTES)
+def test_accessible_pairs_meet_the_ratio(palette):
+    pairs = accessible_pairs(palette, palette + ["#ffffff", "#000000"])
+    backgrounds, texts = zip(*pairs)
+    assert min(ratios(texts, backgrounds)) >= AA_NORMAL
+
+
+@pytest.mark.parametrize("palette", PALETTES)
+def test_themed_elements_are_readable(palette):
+    axes = elements.palette_axes(palette)
+    for bg, fg, outline in axes["buttons"]["colors"]:
+        assert ratios([fg], [bg])[0] >= AA_NORMAL
+        assert ratios([outline], [CANVAS])[0] >= AA_NORMAL
+    badges = axes["badges"]["color"]
+    assert min(ratios(["#ffffff"] * len(badges), badges)) >= AA_NORMAL
+    for name in ("frames", "titles"):
+        colors = axes[name]["color"]
+        assert min(ratios(colors, [CANVAS] * len(colors))) >= AA_LARGE
+
+
+@pytest.mark.parametrize("palette", PALETTES)
+def test_themed_text_styles_are_readable(palette):
+    axes = text_styles.palette_axes(palette)
+    backgrounds = axes["Social"]["background"]
+    assert min(ratios(["#ffffff"] * len(backgrounds), backgrounds)) >= AA_LARGE
+    for name in ("Headlines", "Sale", "Luxury", "Retro", "Fun", "Outline"):
+        colors = axes[name]["color"]
+        assert min(ratios(colors, [CANVAS] * len(colors))) >= AA_LARGE
+
+
+def test_on_canvas_drops_repeats():
+    assert on_canvas(["#ffffff", "#fff", "#000000"]) == ensure_contrast(["#ffffff"], CANVAS, AA_LARGE) + ["#000000"]
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from catalog.compact import FORMAT, decode, encode
+
+
+def test_round_trip(catalog_records):
+    assert decode(encode(catalog_records)) == catalog_records
+
+
+def test_round_trip_through_json(catalog_records):
+    data = json.loads(json.dumps(encode(catalog_records)))
+    assert decode(data) == catalog_records
+
+
+def test_literals_and_absent_fields():
+    records = [
+        {"id": "a", "label": "One", "style": {"fontSize": 12, "bold": True, "shadow": None}},
+        {"id": "b", "payload": {"nested": {"color": "#ffffff"}}, "width": 1.5},
+        {"id": "c", "label": "One", "style": {"fontSize": 12, "bold": True, "shadow": None}},
+    ]
+    encoded = encode(records)
+    assert encoded["format"] == FORMAT
+    # The repeated style object is stored once
+    assert encoded["items"][0][2] == encoded["items"][2][2]
+    assert decode(encoded) == records
+
+
+def test_decoded_objects_are_independent(catalog_records):
+    decoded = decode(encode(catalog_records))
+    styled = [item for item in decoded if "style" in item or "payload" in item]
+    first, second = styled[0], styled[1]
+    section = "style" if "style" in first else "payload"
+    first[section]["marker"] = 1
+    assert "marker" not in second.get(section, {})
+
+
+def test_list_values_are_rejected():
+    with pytest.raises(TypeError):
+        encode([{"id": "a", "tags": ["x"]}])
@@ -0,0 +1,63 @@
+import copy
+
+import pytest
+
+from catalog import DEFAULT_SEED
+from catalog.build import build_groups, generator
+from catalog.delta import apply, diff, load_records, records_hash
+from catalog.output import records, write_catalog
+
+
+def _edited(records):
+    new = copy.deepcopy(records[3:])
+    new[0]["label"] = "Renamed"
+    del new[1]["label"]
+    new[2]["style" if "style" in new[2] else "payload"]["color"] = "#123456"
+    new.append({**copy.deepcopy(records[0]), "id": "added-000000000000"})
+    return new
+
+
+def test_apply_inverts_diff(catalog_records):
+    new = _edited(catalog_records)
+    assert apply(catalog_records, diff(catalog_records, new)) == new
+
+
+def test_apply_inverts_diff_with_reorder(catalog_records):
+    new = list(reversed(catalog_records))
+    patch = diff(catalog_records, new)
+    assert "order" in patch
+    assert apply(catalog_records, patch) == new
+
+
+def test_identical_builds_give_an_empty_patch(catalog_records):
+    patch = diff(catalog_records, copy.deepcopy(catalog_records))
+    assert patch["from"] == patch["to"] == records_hash(catalog_records)
+    assert (patch["remove"], patch["add"], patch["modify"]) == ([], [], [])
+    assert "order" not in patch
+
+
+def test_apply_rejects_another_version(catalog_records):
+    patch = diff(catalog_records, _edited(catalog_records))
+    with pytest.raises(ValueError):
+        apply(catalog_records[1:], patch)
+
+
+def test_apply_checks_the_target(catalog_records):
+    patch = diff(catalog_records, _edited(catalog_records))
+    patch["to"] = "0" * 16
+    with pytest.raises(ValueError):
+        apply(catalog_records, patch)
+
+
+def test_diff_rejects_duplicate_ids(catalog_records):
+    with pytest.raises(ValueError):
+        diff(catalog_records, catalog_records + catalog_records[:1])
+
+
+@pytest.mark.parametrize("layout", [{}, {"compact": True}, {"shard": True}, {"shard": True, "compact": True}])
+@pytest.mark.parametrize("catalog", ["textStyles", "stockElements"])
+def test_load_records_reads_every_layout(tmp_path, catalog, layout):
+    module = generator(catalog)
+    groups = build_groups(module.CATEGORIES, DEFAULT_SEED)
+    path = write_catalog(catalog, groups, tmp_path, module.NESTED, **layout)
+    assert load_records(path) == records(groups)
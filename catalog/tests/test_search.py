@@ -0,0 +1,53 @@
+import json
+
+from catalog import DEFAULT_SEED
+from catalog.build import build_groups, generator
+from catalog.search import build_index, item_terms, write_index
+
+GROUPS = [
+    ("Sale", [
+        {"label": "Flash Sale", "style": {"color": "#EF4444", "fontFamily": "'Arial Black', sans-serif"}},
+        {"label": "Deal", "style": {"color": "#fff", "textShadow": "2px 2px 0 rgba(0, 0, 0, 0.5)"}},
+    ]),
+    ("Empty", []),
+    ("shapes", [
+        {"label": "Star", "type": "image", "payload": {"src": "https://example.com/#abc", "width": 100}},
+    ]),
+]
+
+
+def test_item_terms():
+    assert item_terms("Sale", GROUPS[0][1][0]) == {"category:sale", "label:flash", "label:sale", "color:#ef4444", "font:arial black"}
+    assert "color:#ffffff" in item_terms("Sale", GROUPS[0][1][1])
+    assert "color:rgba(0,0,0,0.5)" in item_terms("Sale", GROUPS[0][1][1])
+    # URLs are not searched for colors
+    assert item_terms("shapes", GROUPS[2][1][0]) == {"category:shapes", "label:star", "type:image"}
+
+
+def test_category_offsets():
+    index = build_index(GROUPS)
+    assert index["count"] == 3
+    assert index["categories"] == {"Sale": [0, 2], "Empty": [2, 0], "shapes": [2, 1]}
+
+
+def test_posting_lists():
+    index = build_index(GROUPS)
+    assert index["terms"]["category:sale"] == [0, 1]
+    assert index["terms"]["label:sale"] == [0]
+    assert index["terms"]["type:image"] == [2]
+    assert list(index["terms"]) == sorted(index["terms"])
+
+
+def test_index_matches_the_built_catalog(tmp_path):
+    module = generator("stockElements")
+    groups = build_groups(module.CATEGORIES, DEFAULT_SEED)
+    path = write_index(groups, "stockElements", tmp_path)
+    with open(path, encoding="utf-8") as f:
+        index = json.load(f)
+    flat = [(category, item) for category, items in groups for item in items]
+    assert index["count"] == len(flat)
+    for category, (offset, count) in index["categories"].items():
+        assert {flat[i][0] for i in range(offset, offset + count)} == {category}
+    for term, postings in index["terms"].items():
+        assert postings == sorted(set(postings))
+        assert all(term in item_terms(*flat[i]) for i in postings)
@@ -0,0 +1,107 @@
+import http.client
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from catalog import serve
+from catalog.serve import LRUCache, etag_for, etag_matches, make_handler
+
+URL = "/catalogs/textStyles.json?palette=0f172a,e11d48"
+
+
+def test_lru_evicts_least_recently_used_by_bytes():
+    cache = LRUCache(10)
+    cache.put("a", '"a"', b"1234")
+    cache.put("b", '"b"', b"1234")
+    assert cache.get("a") is not None  # "b" is now the oldest
+    cache.put("c", '"c"', b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.size == 8
+
+
+def test_lru_skips_bodies_over_budget_but_keeps_their_etag():
+    cache = LRUCache(4)
+    cache.put("big", '"big"', b"12345")
+    assert cache.get("big") is None
+    assert cache.size == 0
+    assert cache.etag("big") == '"big"'
+
+
+def test_etags_outlive_evicted_bodies():
+    cache = LRUCache(4, max_etags=2)
+    cache.put("a", '"a"', b"1234")
+    cache.put("b", '"b"', b"1234")
+    assert cache.get("a") is None
+    assert cache.etag("a") == '"a"'  # "b" is now the oldest tag
+    cache.put("c", '"c"', b"1234")
+    assert cache.etag("b") is None
+    assert cache.etag("a") == '"a"'
+
+
+def test_etag_matching():
+    etag = etag_for(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches("", etag)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    builds = []
+
+    def build_themed(catalog, palette, seed):
+        builds.append((catalog, tuple(palette), seed))
+        return b'[{"label":"x"}]'
+
+    monkeypatch.setattr(serve, "build_themed", build_themed)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(LRUCache(1024)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    def get(path, **headers):
+        conn = http.client.HTTPConnection(*httpd.server_address)
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        result = response.status, response.getheader("ETag"), response.read()
+        conn.close()
+        return result
+
+    yield get, builds
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_200_then_304(server):
+    get, builds = server
+    status, etag, body = get(URL)
+    assert (status, body) == (200, b'[{"label":"x"}]')
+    assert etag == etag_for(body)
+
+    assert get(URL, **{"If-None-Match": etag})[:2] == (304, etag)
+    assert get(URL, **{"If-None-Match": f"W/{etag}"})[0] == 304
+    assert get(URL, **{"If-None-Match": '"stale"'})[0] == 200
+    assert len(builds) == 1
+
+
+def test_unknown_etag_rebuilds_once_and_still_revalidates(server):
+    get, builds = server
+    etag = etag_for(b'[{"label":"x"}]')
+    # A fresh process has no ETag for the key yet: build, then compare with the body's tag
+    assert get(URL, **{"If-None-Match": etag})[:2] == (304, etag)
+    assert len(builds) == 1
+
+
+def test_errors(server, monkeypatch):
+    get, _ = server
+    assert get("/catalogs/nope.json?palette=fff")[0] == 404
+    assert get("/catalogs/textStyles.json?palette=zzz")[0] == 400
+
+    def fail(catalog, palette, seed):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(serve, "build_themed", fail)
+    assert get("/catalogs/stockElements.json?palette=fff")[0] == 500
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from catalog import DEFAULT_SEED
+from catalog.stream import stream_records, write_chunks, write_ndjson
+from catalog.text_styles import CATEGORIES
+
+
+def records(n):
+    return [{"id": f"item-{i}", "label": f"“{i}”"} for i in range(n)]
+
+
+def read_chunks(out_dir):
+    manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    loaded = [json.loads((out_dir / chunk["file"]).read_text(encoding="utf-8")) for chunk in manifest["chunks"]]
+    return manifest, loaded
+
+
+def read_chunks_after(out_dir, items, chunk_size, indent=None):
+    write_chunks(out_dir, "cat", items, chunk_size, indent)
+    return read_chunks(out_dir)
+
+
+@pytest.mark.parametrize("n, sizes", [
+    (0, []),
+    (1, [1]),
+    (3, [3]),
+    (4, [4]),
+    (5, [4, 1]),
+    (8, [4, 4]),
+    (12, [4, 4, 4]),
+])
+def test_chunk_boundaries(tmp_path, n, sizes):
+    manifest, loaded = read_chunks_after(tmp_path, records(n), 4)
+    assert [chunk["count"] for chunk in manifest["chunks"]] == sizes
+    assert [len(chunk) for chunk in loaded] == sizes
+    assert [record for chunk in loaded for record in chunk] == records(n)
+    assert manifest["count"] == n
+    # An exact multiple of the chunk size must not leave an empty trailing chunk behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(["manifest.json"] + [c["file"] for c in manifest["chunks"]])
+
+
+def test_indented_chunks_are_valid_json(tmp_path):
+    _, loaded = read_chunks_after(tmp_path, records(5), 2, indent=2)
+    assert [record for chunk in loaded for record in chunk] == records(5)
+
+
+def test_stale_chunks_from_a_longer_run_are_removed(tmp_path):
+    (tmp_path / "notes.txt").write_text("keep", encoding="utf-8")
+    (tmp_path / "other-00009.json").write_text("[]", encoding="utf-8")
+    write_chunks(tmp_path, "cat", records(10), 2)
+    assert (tmp_path / "cat-00004.json").exists()
+    manifest, _ = read_chunks_after(tmp_path, records(3), 2)
+    assert [chunk["file"] for chunk in manifest["chunks"]] == ["cat-00000.json", "cat-00001.json"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "cat-00000.json", "cat-00001.json", "manifest.json", "notes.txt", "other-00009.json"]
+
+
+def test_ndjson(tmp_path):
+    path = tmp_path / "cat.ndjson"
+    assert write_ndjson(path, records(3)) == 3
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == records(3)
+
+
+def test_stream_records_carry_their_category():
+    streamed = list(stream_records(CATEGORIES[:2], DEFAULT_SEED))
+    assert len(streamed) == sum(category.count for category in CATEGORIES[:2])
+    assert {record["category"] for record in streamed} == {category.name for category in CATEGORIES[:2]}
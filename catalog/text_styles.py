@@ -0,0 +1,276 @@
+"""The text styles catalog ("textStyles"): flat items shown under Text -> Font Combinations.
+
+Importing the module only defines the categories; nothing is built or written
+until generate_text_styles() or main() is called.
+"""
+import argparse
+import os
+import sys
+
+from catalog import DATA_DIR, DEFAULT_SEED
+from catalog.artifacts import ARTIFACT_DIR, ARTIFACT_URL, ASSET_MAP, ArtifactError, publish_outputs, write_asset_map
+from catalog.build import build_groups
+from catalog.colors import AA_LARGE, ensure_contrast, on_canvas
+from catalog.delta import load_records, records_hash, summary, write_patch
+from catalog.output import assemble, records, write_catalog, write_stream
+from catalog.search import write_index
+from catalog.thumbnails import ThumbnailError, build_atlas
+from catalog.variants import Category, VariantSpace, select
+
+CATALOG = "textStyles"
+NESTED = False
+
+VIBRANT_COLORS = ['#FF0000', '#00FF00', '#0000FF', '#FFFF00', '#00FFFF', '#FF00FF', '#FF4500', '#FF1493', '#00BFFF', '#32CD32']
+
+def text_style(category, text, style):
+    return {
+        "category": category,
+        "label": text,
+        "preview": text,
+        "style": style
+    }
+
+# 1. Headlines (Bold, Impactful)
+headlines_text = ["BREAKING NEWS", "JUST IN", "BIG ANNOUNCEMENT", "DON'T MISS OUT", "LIMITED TIME", "EXCLUSIVE", "NEW ARRIVAL", "BEST SELLER", "TOP RATED", "TRENDING NOW", "HEADLINE", "ATTENTION", "IMPORTANT", "UPDATE", "NOTICE"]
+fonts_headline = ['Impact, sans-serif', 'Arial Black, sans-serif', 'Verdana, sans-serif', 'Tahoma, sans-serif']
+
+def headline(text, font, color, letter_spacing):
+    return text_style("Headlines", text, {
+        "fontSize": 60,
+        "fontFamily": font,
+        "fontWeight": "900",
+        "color": color,
+        "textTransform": "uppercase",
+        "letterSpacing": letter_spacing,
+        "lineHeight": 1.1
+    })
+
+# 2. Sale / Offer (Urgent, Red/Yellow)
+sale_text = ["SALE", "50% OFF", "BUY 1 GET 1", "CLEARANCE", "FLASH SALE", "PROMO", "DISCOUNT", "SAVE BIG", "HOT DEAL", "FINAL CALL", "OFFER", "DEAL", "BEST PRICE", "HUGE SAVINGS", "LIMITED OFFER"]
+
+def sale(text, color, rotation):
+    return text_style("Sale", text, {
+        "fontSize": 72,
+        "fontFamily": "Arial Black, sans-serif",
+        "fontWeight": "900",
+        "color": color,
+        "textTransform": "uppercase",
+        "textShadow": "2px 2px 0px #ffffff, 4px 4px 0px #000000",
+        "transform": f"rotate({rotation}deg)"
+    })
+
+# 3. Luxury (Serif, Gold/Silver/Black)
+luxury_text = ["Elegant", "Premium", "Exclusive", "Luxury", "Finest Quality", "Sophisticated", "Timeless", "Signature", "Collection", "Boutique", "Opulence", "Grandeur", "Prestige", "Elite", "Refined"]
+fonts_luxury = ['Georgia, serif', 'Times New Roman, serif', 'Palatino, serif']
+luxury_colors = ['#D4AF37', '#C0C0C0', '#000000', '#2C3E50', '#800020']
+
+def luxury(text, font, font_style, color, letter_spacing):
+    return text_style("Luxury", text, {
+        "fontSize": 54,
+        "fontFamily": font,
+        "fontWeight": "400",
+        "fontStyle": font_style,
+        "color": color,
+        "letterSpacing": letter_spacing,
+        "textShadow": "1px 1px 2px rgba(0,0,0,0.1)"
+    })
+
+# 4. Tech / Cyber (Neon, Monospace)
+tech_text = ["CYBER MONDAY", "TECH WEEK", "FUTURE", "DIGITAL", "ONLINE ONLY", "APP EXCLUSIVE", "LOADING...", "SYSTEM READY", "VIRTUAL", "INNOVATION", "DATA", "NETWORK", "CODE", "MATRIX", "GLITCH"]
+fonts_tech = ['Courier New, monospace', 'Lucida Console, monospace']
+neon_colors = ['#00ff00', '#ff00ff', '#00ffff', '#ffff00']
+
+def tech(text, font, color):
+    return text_style("Tech", text, {
+        "fontSize": 48,
+        "fontFamily": font,
+        "fontWeight": "bold",
+        "color": "#ffffff",
+        "textShadow": f"0 0 5px {color}, 0 0 10px {color}, 0 0 20px {color}",
+        "textTransform": "uppercase",
+        "letterSpacing": 2
+    })
+
+# 5. Retro (Layered Shadows, Serif/Display)
+retro_text = ["RETRO", "VINTAGE", "CLASSIC", "OLD SCHOOL", "THROWBACK", "NOSTALGIA", "GROOVY", "RADICAL", "ARCADE", "REWIND", "DISCO", "FUNKY", "VIBE", "STYLE", "COOL"]
+
+def retro(text, color, shadow_color):
+    return text_style("Retro", text, {
+        "fontSize": 60,
+        "fontFamily": "Georgia, serif",
+        "fontWeight": "900",
+        "color": color,
+        "textShadow": f"3px 3px 0px {shadow_color}, 6px 6px 0px #000000",
+        "fontStyle": "italic"
+    })
+
+# 6. Minimal (Clean, Sans-serif)
+minimal_text = ["Simple.", "Clean.", "Minimal.", "Less is more.", "Pure.", "Essential.", "Basic.", "Modern.", "Sleek.", "Fresh.", "White.", "Space.", "Calm.", "Soft.", "Light."]
+fonts_minimal = ['Arial, sans-serif', 'Helvetica, sans-serif', 'Segoe UI, sans-serif']
+
+def minimal(text, font, weight, letter_spacing, transform):
+    return text_style("Minimal", text, {
+        "fontSize": 42,
+        "fontFamily": font,
+        "fontWeight": weight,
+        "color": "#333333",
+        "letterSpacing": letter_spacing,
+        "textTransform": transform
+    })
+
+# 7. Fun / Playful (Rounded, Colorful)
+fun_text = ["Party!", "Fun!", "Wow!", "Amazing!", "Cool!", "Yay!", "Pop!", "Boom!", "Zap!", "Omg!", "Super!", "Sweet!", "Nice!", "Yolo!", "Epic!"]
+fonts_fun = ['Comic Sans MS, cursive', 'Arial Rounded MT Bold, sans-serif']
+
+def fun(text, font, color):
+    return text_style("Fun", text, {
+        "fontSize": 56,
+        "fontFamily": font,
+        "fontWeight": "bold",
+        "color": color,
+        "WebkitTextStroke": "1px #000000",
+        "textShadow": "2px 2px 0px rgba(0,0,0,0.2)"
+    })
+
+# 8. Quote (Italic, Serif)
+quote_text = ["“Dream Big”", "“Stay Wild”", "“Be Kind”", "“Good Vibes”", "“Just Do It”", "“Live Laugh Love”", "“Carpe Diem”", "“Stay Focused”", "“Keep Going”", "“You Got This”", "“Believe”", "“Inspire”", "“Create”", "“Love”", "“Hope”"]
+
+def quote(text):
+    return text_style("Quote", text, {
+        "fontSize": 48,
+        "fontFamily": "Georgia, serif",
+        "fontStyle": "italic",
+        "color": "#4a5568",
+        "textAlign": "center",
+        "lineHeight": 1.4
+    })
+
+# 9. Social Media (Trendy, Bold)
+social_text = ["#OOTD", "#TBT", "#FYP", "#Viral", "#Trending", "#Love", "#InstaGood", "#FollowMe", "#Like", "#Share", "#Subscribe", "#LinkInBio", "#NewPost", "#Giveaway", "#Contest"]
+
+def social(text, background):
+    return text_style("Social", text, {
+        "fontSize": 52,
+        "fontFamily": "Arial, sans-serif",
+        "fontWeight": "800",
+        "color": "#ffffff",
+        "backgroundColor": background,
+        "padding": "10px",
+        "borderRadius": "8px",
+        "textTransform": "uppercase"
+    })
+
+# 10. Outline (Stroke heavy)
+outline_text = ["OUTLINE", "STROKE", "HOLLOW", "BORDER", "EDGE", "FRAME", "TRANSPARENT", "GHOST", "SKETCH", "DRAWING", "LINE", "SHAPE", "FORM", "CONTOUR", "TRACE"]
+
+def outline(text, color):
+    return text_style("Outline", text, {
+        "fontSize": 64,
+        "fontFamily": "Impact, sans-serif",
+        "fontWeight": "900",
+        "color": "transparent",
+        "WebkitTextStroke": f"2px {color}"
+    })
+
+CATEGORIES = [
+    Category("Headlines", 50, VariantSpace({"text": headlines_text, "font": fonts_headline, "color": ['#000000', '#1a1a1a', '#2d3748', '#1e3a8a', '#b91c1c'], "letter_spacing": range(-2, 3)}, headline)),
+    Category("Sale", 50, VariantSpace({"text": sale_text, "color": ['#ef4444', '#f97316', '#eab308', '#dc2626'], "rotation": range(-5, 6)}, sale)),
+    Category("Luxury", 50, VariantSpace({"text": luxury_text, "font": fonts_luxury, "font_style": ["normal", "italic"], "color": luxury_colors, "letter_spacing": range(1, 5)}, luxury)),
+    Category("Tech", 50, VariantSpace({"text": tech_text, "font": fonts_tech, "color": neon_colors}, tech)),
+    Category("Retro", 50, VariantSpace({"text": retro_text, "color": VIBRANT_COLORS, "shadow_color": VIBRANT_COLORS}, retro)),
+    Category("Minimal", 50, VariantSpace({"text": minimal_text, "font": fonts_minimal, "weight": ["300", "400", "500"], "letter_spacing": range(1, 4), "transform": ["none", "uppercase", "lowercase"]}, minimal)),
+    Category("Fun", 50, VariantSpace({"text": fun_text, "font": fonts_fun, "color": VIBRANT_COLORS}, fun)),
+    Category("Quote", 50, VariantSpace({"text": quote_text}, quote)),
+    Category("Social", 50, VariantSpace({"text": social_text, "background": VIBRANT_COLORS}, social)),
+    Category("Outline", 50, VariantSpace({"text": outline_text, "color": VIBRANT_COLORS}, outline)),
+]
+
+def palette_axes(palette):
+    """Axis overrides that remap every color axis onto a brand palette."""
+    # Every style is 42px or larger, so text on the canvas needs AA large-text contrast
+    text = on_canvas(palette)
+    return {
+        "Headlines": {"color": text},
+        "Sale": {"color": text},
+        "Luxury": {"color": text},
+        # Only the glow around the text; the glyphs themselves stay white
+        "Tech": {"color": palette},
+        # The text color must read on the canvas; its offset shadow is decoration backed by a black one
+        "Retro": {"color": text, "shadow_color": palette},
+        "Fun": {"color": text},
+        # White 52px text on the background: AA large-text contrast
+        "Social": {"background": list(dict.fromkeys(ensure_contrast(palette, "#ffffff", AA_LARGE)))},
+        # The stroke is the whole glyph
+        "Outline": {"color": text},
+    }
+
+def generate_text_styles(seed=DEFAULT_SEED, cache=False, categories=None):
+    """Build the catalog in its file layout; `categories` limits it to those category names."""
+    return assemble(build_groups(select(CATEGORIES, categories), seed, CATALOG if cache else None), NESTED)
+
+def write_artifacts(args, paths, versions=None, extra=None):
+    try:
+        map_path, assets = publish_outputs(paths, args.out_dir, args.artifact_dir, args.artifact_url, versions, extra)
+    except ArtifactError as e:
+        sys.exit(f"error: {e}")
+    print(f"Published {len(assets)} artifact(s), asset map: {map_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the TemplateBuilder text styles catalog.")
+    parser.add_argument("--out-dir", default=DATA_DIR, help="directory for the generated files (default: the TemplateBuilder data directory)")
+    parser.add_argument("--shard", action="store_true", help="write one file per category plus a manifest instead of a single JSON file")
+    parser.add_argument("--seed", default=DEFAULT_SEED, help=f"seed for variant sampling (default: {DEFAULT_SEED})")
+    parser.add_argument("--no-cache", action="store_true", help="rebuild every category instead of reusing unchanged ones from .cache/catalog")
+    parser.add_argument("--compact", action="store_true", help="use the dictionary-encoded compact/1 format (see catalog/compact.py)")
+    parser.add_argument("--search-index", action="store_true", help=f"also write {CATALOG}.index.json, an inverted index for search and category lookups")
+    parser.add_argument("--thumbnails", choices=["webp", "png"], help="pre-render previews into hashed sprite atlases in --artifact-dir (requires Pillow)")
+    parser.add_argument("--minify", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--stream", choices=["ndjson", "chunks"], help="stream items to NDJSON or chunked JSON arrays with constant memory")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="records per file with --stream chunks (default: 10000)")
+    parser.add_argument("--patch-from", metavar="PREVIOUS", help="also write a delta patch from this previous build (any layout) to the new one")
+    parser.add_argument("--artifacts", action="store_true", help=f"also publish content-hashed .json/.gz/.br copies and update <out-dir>/{ASSET_MAP} (requires brotli)")
+    parser.add_argument("--artifact-dir", default=ARTIFACT_DIR, help="where hashed files (--artifacts, --thumbnails, the icon sprite) are written (default: public/catalog)")
+    parser.add_argument("--artifact-url", default=ARTIFACT_URL, help=f"URL prefix the hashed files are served under (default: {ARTIFACT_URL})")
+    args = parser.parse_args()
+
+    if args.stream:
+        if args.shard or args.compact or args.thumbnails or args.search_index or args.patch_from:
+            parser.error("--stream writes items as they are generated and can't be combined with whole-catalog stages")
+        path = write_stream(CATALOG, CATEGORIES, args.seed, args.out_dir, args.stream, args.chunk_size, None if args.minify else 2)
+        print(f"Streamed {CATALOG} to {path}")
+        if args.artifacts:
+            write_artifacts(args, [path])
+        return
+
+    groups = build_groups(CATEGORIES, args.seed, None if args.no_cache else CATALOG)
+    # Files the items link to (atlases), published to the artifact directory before the catalog
+    published = {}
+    if args.thumbnails:
+        try:
+            atlases = build_atlas(groups, CATALOG, args.thumbnails, args.artifact_dir, args.artifact_url)
+        except ThumbnailError as e:
+            sys.exit(f"error: {e}")
+        published.update(atlases)
+        print(f"Rendered thumbnails into {len(atlases)} atlas page(s) in {args.artifact_dir}")
+    outputs = []
+    if args.search_index:
+        outputs.append(write_index(groups, CATALOG, args.out_dir))
+    if args.patch_from:
+        try:
+            path, patch = write_patch(load_records(args.patch_from), records(groups), args.out_dir, CATALOG)
+        except ValueError as e:
+            sys.exit(f"error: {e}")
+        outputs.append(path)
+        print(f"Wrote {path}: {summary(patch)}")
+    # The hash patches use as "from"/"to", published so clients can find their patch
+    version = records_hash(records(groups))
+    output_path = write_catalog(CATALOG, groups, args.out_dir, NESTED, shard=args.shard, compact=args.compact, indent=None if args.minify else 2)
+
+    print(f"Generated {sum(len(items) for _, items in groups)} text styles, version {version}.")
+    if args.artifacts:
+        write_artifacts(args, [output_path] + outputs, {os.path.basename(output_path): version}, published)
+    elif published:
+        write_asset_map(published, os.path.join(args.out_dir, ASSET_MAP))
+
+if __name__ == "__main__":
+    main()
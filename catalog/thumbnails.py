@@ -0,0 +1,314 @@
+"""Pre-rendered preview thumbnails packed into sprite atlases.
+
+Each text style / text or frame element is rasterized once at build time with
+locally installed fonts (falling back to generic families when a font is not
+available) and packed into a fixed-cell atlas. Items get a `thumb` entry with
+the atlas URL and their cell coordinates, so panels can show a cheap cropped
+background image and only create live styled text on drop.
+
+Each category gets its own atlas pages, matching the per-category shards, so
+opening a panel tab only downloads that tab's thumbnails.
+
+Requires Pillow (`pip install pillow`), which is imported on first use so the
+generators don't load it unless --thumbnails is given.
+"""
+import io
+import math
+import os
+import re
+import sys
+
+from catalog.artifacts import ARTIFACT_DIR, ARTIFACT_URL, publish_data
+from catalog.shards import slugify
+
+# Pillow modules, bound by _load_pil()
+Image = ImageColor = ImageDraw = ImageFilter = ImageFont = None
+
+CELL_SIZE = (160, 90)
+MAX_ATLAS_SIZE = 4096
+
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+]
+
+# CSS family -> candidate font file stems (lowercase, without extension)
+FONT_FILES = {
+    "impact": ["impact"],
+    "arial black": ["ariblk", "arial black", "arial-black"],
+    "arial": ["arial", "liberationsans-regular"],
+    "arial rounded mt bold": ["arlrdbd", "arial rounded bold"],
+    "helvetica": ["helvetica", "liberationsans-regular"],
+    "verdana": ["verdana"],
+    "tahoma": ["tahoma"],
+    "segoe ui": ["segoeui"],
+    "georgia": ["georgia"],
+    "times new roman": ["times", "times new roman", "liberationserif-regular"],
+    "palatino": ["pala", "palatino linotype", "palatino"],
+    "courier new": ["cour", "courier new", "liberationmono-regular"],
+    "lucida console": ["lucon", "lucida console"],
+    "comic sans ms": ["comic", "comic sans ms"],
+    "inter": ["inter-regular", "inter"],
+    "sans-serif": ["dejavusans", "liberationsans-regular", "arial"],
+    "serif": ["dejavuserif", "liberationserif-regular", "times"],
+    "monospace": ["dejavusansmono", "liberationmono-regular", "cour"],
+    "cursive": ["comic", "dejavusans"],
+    "fantasy": ["impact", "dejavusans"],
+}
+BOLD_SUFFIXES = ["-bold", "bd", " bold", "b"]
+
+
+class ThumbnailError(Exception):
+    pass
+
+
+def _load_pil():
+    global Image, ImageColor, ImageDraw, ImageFilter, ImageFont
+    if Image is not None:
+        return
+    try:
+        from PIL import Image, ImageColor, ImageDraw, ImageFilter, ImageFont
+    except ImportError:  # optional dependency, only needed for --thumbnails
+        raise ThumbnailError("Pillow is required for thumbnails (pip install pillow)") from None
+
+
+class FontResolver:
+    def __init__(self, dirs=FONT_DIRS):
+        _load_pil()
+        self.files = {}
+        for directory in dirs:
+            for root, _, names in os.walk(directory):
+                for name in names:
+                    stem, ext = os.path.splitext(name)
+                    if ext.lower() in (".ttf", ".otf", ".ttc"):
+                        self.files.setdefault(stem.lower(), os.path.join(root, name))
+        self._fonts = {}
+        self.missing = set()
+
+    def _path(self, family, bold):
+        for stem in FONT_FILES.get(family, [family]):
+            candidates = [stem + suffix for suffix in BOLD_SUFFIXES] + [stem] if bold else [stem]
+            for candidate in candidates:
+                if candidate in self.files:
+                    return self.files[candidate]
+        return None
+
+    def font(self, stack, weight, size):
+        bold = weight == "bold" or (str(weight).isdigit() and int(weight) >= 600)
+        families = [f.strip().strip("'\"").lower() for f in (stack or "sans-serif").split(",")]
+        key = (tuple(families), bold, size)
+        if key not in self._fonts:
+            path = None
+            for family in families + ["sans-serif"]:
+                path = self._path(family, bold)
+                if path:
+                    break
+                self.missing.add(family)
+            self._fonts[key] = ImageFont.truetype(path, size) if path else ImageFont.load_default(size)
+        return self._fonts[key]
+
+
+def parse_color(value):
+    """CSS color -> RGBA tuple, or None for transparent."""
+    value = (value or "").strip().lower()
+    if not value or value == "transparent":
+        return None
+    match = re.fullmatch(r"rgba?\(([^)]*)\)", value)
+    if match:
+        parts = [p.strip() for p in match.group(1).split(",")]
+        alpha = round(float(parts[3]) * 255) if len(parts) > 3 else 255
+        return tuple(int(float(p)) for p in parts[:3]) + (alpha,)
+    rgba = ImageColor.getcolor(value, "RGBA")
+    return rgba if rgba[3] else None
+
+
+def _split_layers(value):
+    # Split a shadow list on commas that are not inside rgba(...)
+    return [layer.strip() for layer in re.split(r",(?![^(]*\))", value or "") if layer.strip()]
+
+
+def _px(token):
+    return float(token[:-2]) if token.endswith("px") else float(token)
+
+
+def parse_shadows(value):
+    """textShadow / boxShadow -> [(dx, dy, blur, rgba)], in CSS paint order (first on top)."""
+    shadows = []
+    for layer in _split_layers(value):
+        color_match = re.search(r"(?:^|\s)(rgba?\([^)]*\)|#[0-9a-fA-F]+|[a-zA-Z]+)\s*$", layer)
+        color = parse_color(color_match.group(1)) if color_match else (0, 0, 0, 255)
+        lengths = layer[:color_match.start()].split() if color_match else layer.split()
+        lengths = [_px(t) for t in lengths if t not in ("inset",)]
+        dx, dy = lengths[0], lengths[1]
+        blur = lengths[2] if len(lengths) > 2 else 0
+        if color:
+            shadows.append((dx, dy, blur, color))
+    return shadows
+
+
+def _padding(value):
+    if value is None:
+        return (0, 0, 0, 0)
+    parts = [_px(p) for p in value.split()] if isinstance(value, str) else [float(value)]
+    if len(parts) == 1:
+        return parts * 4
+    if len(parts) == 2:
+        return parts[0], parts[1], parts[0], parts[1]
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2], parts[1]
+    return tuple(parts[:4])
+
+
+def _length(value, default=0):
+    if value is None or value == "auto":
+        return default
+    return _px(value) if isinstance(value, str) else float(value)
+
+
+def _rotation(transform):
+    match = re.search(r"rotate\((-?[\d.]+)deg\)", transform or "")
+    return float(match.group(1)) if match else 0
+
+
+def render_style(style, text, fonts):
+    """Rasterize one CSS text style into a tightly cropped RGBA image."""
+    if style.get("textTransform") == "uppercase":
+        text = text.upper()
+    elif style.get("textTransform") == "lowercase":
+        text = text.lower()
+
+    size = max(1, round(_length(style.get("fontSize"), 16)))
+    font = fonts.font(style.get("fontFamily"), style.get("fontWeight", "400"), size)
+    stroke_width, stroke_fill = 0, None
+    if style.get("WebkitTextStroke"):
+        width, _, color = style["WebkitTextStroke"].partition(" ")
+        stroke_width, stroke_fill = max(1, round(_px(width))), parse_color(color)
+
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    left, top, right, bottom = probe.textbbox((0, 0), text, font=font, stroke_width=stroke_width)
+    text_w, text_h = right - left, bottom - top
+
+    pad_top, pad_right, pad_bottom, pad_left = _padding(style.get("padding"))
+    box_w = max(text_w + pad_left + pad_right, _length(style.get("width"), 0))
+    box_h = max(text_h + pad_top + pad_bottom, _length(style.get("height"), 0))
+    border_width, border_color = 0, None
+    if style.get("border"):
+        parts = style["border"].split()
+        border_width, border_color = round(_px(parts[0])), parse_color(parts[-1])
+
+    shadows = parse_shadows(style.get("textShadow"))
+    margin = math.ceil(max([abs(dx) + abs(dy) + blur * 2 for dx, dy, blur, _ in shadows] + [0])) + stroke_width + 2
+    canvas = Image.new("RGBA", (math.ceil(box_w) + 2 * margin, math.ceil(box_h) + 2 * margin), (0, 0, 0, 0))
+
+    background = parse_color(style.get("backgroundColor"))
+    if background or border_color:
+        radius = min(_length(style.get("borderRadius"), 0), box_h / 2, box_w / 2)
+        ImageDraw.Draw(canvas).rounded_rectangle(
+            [margin, margin, margin + box_w - 1, margin + box_h - 1], radius=radius,
+            fill=background, outline=border_color, width=border_width)
+
+    origin = (margin + (box_w - text_w) / 2 - left, margin + (box_h - text_h) / 2 - top)
+    # CSS paints the first shadow on top, so draw them back to front
+    for dx, dy, blur, color in reversed(shadows):
+        layer = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).text((origin[0] + dx, origin[1] + dy), text, font=font, fill=color)
+        if blur:
+            layer = layer.filter(ImageFilter.GaussianBlur(blur / 2))
+        canvas.alpha_composite(layer)
+
+    fill = parse_color(style.get("color")) or (0, 0, 0, 0)
+    ImageDraw.Draw(canvas).text(origin, text, font=font, fill=fill,
+                                stroke_width=stroke_width, stroke_fill=stroke_fill)
+
+    angle = _rotation(style.get("transform"))
+    if angle:
+        canvas = canvas.rotate(-angle, resample=Image.BICUBIC, expand=True)
+    bbox = canvas.getbbox()
+    return canvas.crop(bbox) if bbox else canvas
+
+
+def render_item(item, fonts):
+    """Render a catalog item, or return None when it has no preview (e.g. icons)."""
+    _load_pil()
+    if "style" in item:
+        return render_style(item["style"], item.get("preview", item.get("label", "")), fonts)
+    payload = item.get("payload", {})
+    if item.get("type") == "text":
+        return render_style(payload, payload.get("content", ""), fonts)
+    if item.get("type") in ("rectangle", "circle") and payload:
+        width, height = round(_length(payload.get("width"), 100)), round(_length(payload.get("height"), 100))
+        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(canvas)
+        border_width, border_color = 0, None
+        if payload.get("border"):
+            parts = payload["border"].split()
+            border_width, border_color = round(_px(parts[0])), parse_color(parts[-1])
+        fill = parse_color(payload.get("backgroundColor"))
+        box = [0, 0, width - 1, height - 1]
+        if item["type"] == "circle":
+            draw.ellipse(box, fill=fill, outline=border_color, width=border_width)
+        else:
+            radius = min(_length(payload.get("borderRadius"), 0), width / 2, height / 2)
+            draw.rounded_rectangle(box, radius=radius, fill=fill, outline=border_color, width=border_width)
+        return canvas
+    return None
+
+
+def build_atlas(groups, catalog, image_format="webp", out_dir=ARTIFACT_DIR, base_url=ARTIFACT_URL, cell_size=CELL_SIZE):
+    """Render every previewable item of `groups` into per-category atlas pages and set item["thumb"].
+
+    Pages are published under content-hashed names in `out_dir` (see
+    artifacts.publish_data). Returns their asset map entries.
+    """
+    _load_pil()
+    fonts = FontResolver()
+    published = {}
+    for category, items in groups:
+        rendered = []
+        for item in items:
+            image = render_item(item, fonts)
+            if image is not None:
+                rendered.append((item, image))
+        published.update(_write_pages(rendered, f"{catalog}-{slugify(category)}", image_format,
+                                      out_dir, base_url, cell_size))
+    if fonts.missing:
+        print(f"Thumbnails: no local font for {', '.join(sorted(fonts.missing))}; used fallbacks", file=sys.stderr)
+    return published
+
+
+def _write_pages(rendered, name, image_format, out_dir, base_url, cell_size):
+    cell_w, cell_h = cell_size
+    columns = max(1, min(len(rendered), MAX_ATLAS_SIZE // cell_w))
+    rows_per_page = max(1, MAX_ATLAS_SIZE // cell_h)
+    per_page = columns * rows_per_page
+    published = {}
+    for page, start in enumerate(range(0, len(rendered), per_page)):
+        chunk = rendered[start:start + per_page]
+        rows = math.ceil(len(chunk) / columns)
+        atlas = Image.new("RGBA", (columns * cell_w, rows * cell_h), (0, 0, 0, 0))
+        cells = []
+        for index, (item, image) in enumerate(chunk):
+            image = image.copy()
+            image.thumbnail((cell_w - 4, cell_h - 4), Image.LANCZOS)
+            x, y = (index % columns) * cell_w, (index // columns) * cell_h
+            atlas.alpha_composite(image, (x + (cell_w - image.width) // 2, y + (cell_h - image.height) // 2))
+            cells.append((item, x, y))
+
+        buffer = io.BytesIO()
+        if image_format == "webp":
+            atlas.save(buffer, "WEBP", quality=85, alpha_quality=90, method=4)
+        else:
+            atlas.quantize(256, method=Image.FASTOCTREE).save(buffer, "PNG", optimize=True)
+        data = buffer.getvalue()
+        filename = f"{name}-atlas-{page}.{image_format}"
+        # WebP and PNG are already compressed
+        entry = published[filename] = publish_data(filename, data, out_dir, base_url, compress=False)
+        for item, x, y in cells:
+            item["thumb"] = {"atlas": entry["url"], "x": x, "y": y, "w": cell_w, "h": cell_h}
+    return published
@@ -0,0 +1,155 @@
+import copy
+import hashlib
+import itertools
+import json
+import math
+import random
+
+from catalog.canonical import canonicalize
+from catalog.dedup import take_unique
+from catalog.shards import slugify
+
+
+class VariantSpace:
+    """The cross product of a category's axes, built one item at a time.
+
+    `axes` maps axis names to value lists; `build` is called with one value
+    per axis as keyword arguments. Items are addressed by their index in the
+    product, so sampling never materializes the product itself.
+    """
+
+    def __init__(self, axes, build):
+        self.axes = {name: list(values) for name, values in axes.items()}
+        self.build = build
+        self.size = 1
+        for values in self.axes.values():
+            self.size *= len(values)
+
+    def choice(self, index):
+        # Mixed-radix decode, last axis varies fastest
+        choice = {}
+        for name, values in reversed(self.axes.items()):
+            index, digit = divmod(index, len(values))
+            choice[name] = values[digit]
+        return choice
+
+    def entry(self, index):
+        # The axis choice identifies the item independently of how it is rendered
+        choice = self.choice(index)
+        return choice, self.build(**choice)
+
+    def sample(self, rng):
+        """Yield every (choice, item) entry of the space once, in random order, lazily."""
+        for index in sample_indices(self.size, rng):
+            yield self.entry(index)
+
+    def permuted(self, rng):
+        """Like sample(), but in constant memory.
+
+        Walks the affine permutation i -> (a * i + b) mod size with `a` coprime
+        to the size, which visits every index exactly once without tracking
+        which ones were used. The order is less random than sample()'s.
+        """
+        if self.size == 0:
+            return
+        a = 1
+        if self.size > 2:
+            a = rng.randrange(1, self.size)
+            while math.gcd(a, self.size) != 1:
+                a = rng.randrange(1, self.size)
+        b = rng.randrange(self.size)
+        for i in range(self.size):
+            yield self.entry((a * i + b) % self.size)
+
+
+def sample_indices(size, rng):
+    """Yield distinct indices in range(size) in random order.
+
+    Uses rejection sampling while the space is mostly unused, then shuffles
+    the remainder, so the work done is proportional to the indices consumed.
+    """
+    seen = set()
+    while len(seen) * 2 < size:
+        index = rng.randrange(size)
+        if index not in seen:
+            seen.add(index)
+            yield index
+    remaining = [i for i in range(size) if i not in seen]
+    rng.shuffle(remaining)
+    yield from remaining
+
+
+class Category:
+    """A catalog category: fixed items first, then variants sampled from `space`."""
+
+    def __init__(self, name, count, space=None, items=()):
+        self.name = name
+        self.count = count
+        self.space = space
+        self.items = list(items)
+
+
+def with_overrides(category, axes=None, count=None):
+    """Copy of `category` with some axes replaced (e.g. translated texts or brand colors)."""
+    space = category.space
+    if axes:
+        unknown = set(axes) - set(space.axes if space else ())
+        if unknown:
+            raise ValueError(f"{category.name}: unknown axes {sorted(unknown)}")
+        space = VariantSpace({**space.axes, **axes}, space.build)
+    return Category(category.name, category.count if count is None else count, space, category.items)
+
+
+def select(categories, names=None):
+    """The categories called `names`, in declaration order (all of them for None)."""
+    if names is None:
+        return list(categories)
+    unknown = set(names) - {category.name for category in categories}
+    if unknown:
+        raise ValueError(f"unknown categories {sorted(unknown)}")
+    return [category for category in categories if category.name in names]
+
+
+def category_rng(seed, name):
+    # Each category gets its own stream so categories can be built independently
+    return random.Random(f"{seed}:{name}") if seed is not None else random.Random()
+
+
+def item_id(category, key):
+    """Stable ID for the item identified by `key` within `category`.
+
+    Variant items are keyed by their axis choice and fixed items by label and
+    type, so an ID survives reordering, resampling and style tweaks to its
+    builder; it only changes when the item itself is replaced.
+    """
+    canonical = json.dumps(key, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"{slugify(category)}-{hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]}"
+
+
+def _identified(category, variants):
+    # Fixed items are copied so later stages can't mutate the definitions
+    entries = (({"label": item.get("label"), "type": item.get("type")}, item)
+               for item in copy.deepcopy(category.items))
+    for key, item in itertools.chain(entries, variants):
+        # An explicit "id" on a fixed item wins over the derived one. Values are
+        # canonicalized before dedup so items that only differ in notation collide
+        yield canonicalize({"id": item_id(category.name, key), **item})
+
+
+def build_category(category, seed=None, stats=None):
+    variants = ()
+    if category.space is not None:
+        variants = category.space.sample(category_rng(seed, category.name))
+    return take_unique(_identified(category, variants), category.count, category.name, stats)
+
+
+def stream_category(category, seed=None):
+    """Lazy counterpart of build_category() with constant memory use.
+
+    Items from distinct variant indices are assumed distinct, so there is no
+    content-hash dedup (it would need memory proportional to the item count).
+    """
+    variants = ()
+    if category.space is not None:
+        variants = category.space.permuted(category_rng(seed, category.name))
+    return itertools.islice(_identified(category, variants), category.count)
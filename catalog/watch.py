@@ -0,0 +1,121 @@
+"""Keep catalogs up to date while their definitions are edited.
+
+    python -m catalog.watch                          # both catalogs, data directory
+    python -m catalog.watch textStyles --shard       # one catalog, one file per category
+
+One warm process polls the generator modules (catalog/text_styles.py,
+catalog/elements.py). When a file changes, its module is reloaded and every
+category's fingerprint (see cache.category_fingerprint) is compared with the
+last build; only categories whose definition, builder or helpers changed are
+rebuilt. Unchanged output files are not rewritten, so with --shard a dev
+server only reloads the shard that changed.
+
+Changes to the shared build code (the rest of catalog/) need a restart.
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+import traceback
+
+from catalog import DATA_DIR, DEFAULT_SEED
+from catalog.build import GENERATORS, generator
+from catalog.cache import build_cached, category_fingerprint
+from catalog.output import write_catalog
+
+
+class Watcher:
+    """Rebuilds one catalog, category by category, as its module changes."""
+
+    def __init__(self, catalog, seed=DEFAULT_SEED, out_dir=DATA_DIR, shard=False, compact=False, indent=2):
+        self.catalog = catalog
+        self.seed = seed
+        self.out_dir = out_dir
+        self.layout = {"shard": shard, "compact": compact, "indent": indent}
+        self.module = generator(catalog)
+        self.path = self.module.__file__
+        self.mtime = None
+        self.fingerprints = {}
+        self.items = {}
+
+    def changed(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            # Editors that save by rename briefly remove the file
+            return False
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        return True
+
+    def refresh(self, reload=True):
+        """Rebuild the categories that changed and rewrite the output; returns their names."""
+        if reload:
+            self.module = importlib.reload(self.module)
+        categories = self.module.CATEGORIES
+        rebuilt = []
+        fingerprints = {}
+        for category in categories:
+            fingerprint = category_fingerprint(category, self.seed)
+            fingerprints[category.name] = fingerprint
+            if self.fingerprints.get(category.name) != fingerprint:
+                # Through the build cache, so a later full build reuses the work
+                self.items[category.name], _ = build_cached(category, self.seed, self.catalog)
+                rebuilt.append(category.name)
+        removed = set(self.fingerprints) - set(fingerprints)
+        self.fingerprints = fingerprints
+        self.items = {name: self.items[name] for name in fingerprints}
+        if rebuilt or removed:
+            groups = [(category.name, self.items[category.name]) for category in categories]
+            write_catalog(self.catalog, groups, self.out_dir, self.module.NESTED, **self.layout)
+        return rebuilt
+
+
+def watch(watchers, interval=0.3):
+    """Poll until interrupted; a broken edit is reported and the last good output kept."""
+    while True:
+        for watcher in watchers:
+            if not watcher.changed():
+                continue
+            start = time.perf_counter()
+            try:
+                rebuilt = watcher.refresh()
+            except Exception:
+                traceback.print_exc()
+                print(f"{watcher.catalog}: build failed, keeping the previous output", file=sys.stderr)
+                continue
+            if rebuilt:
+                print(f"{watcher.catalog}: rebuilt {', '.join(rebuilt)} in {time.perf_counter() - start:.2f}s")
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate catalogs as their definitions change.")
+    parser.add_argument("catalogs", nargs="*", help=f"catalogs to watch: {', '.join(sorted(GENERATORS))} (default: all)")
+    parser.add_argument("--out-dir", default=DATA_DIR, help="directory for the generated files (default: the TemplateBuilder data directory)")
+    parser.add_argument("--seed", default=DEFAULT_SEED)
+    parser.add_argument("--shard", action="store_true", help="write one file per category plus a manifest")
+    parser.add_argument("--compact", action="store_true", help="use the compact/1 encoding")
+    parser.add_argument("--minify", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--interval", type=float, default=0.3, help="seconds between polls (default: 0.3)")
+    args = parser.parse_args()
+    unknown = set(args.catalogs) - set(GENERATORS)
+    if unknown:
+        parser.error(f"unknown catalogs {sorted(unknown)}")
+
+    watchers = [Watcher(catalog, args.seed, args.out_dir, args.shard, args.compact, None if args.minify else 2)
+                for catalog in args.catalogs or sorted(GENERATORS)]
+    for watcher in watchers:
+        watcher.changed()
+        watcher.refresh(reload=False)
+        print(f"{watcher.catalog}: watching {os.path.relpath(watcher.path)}")
+    try:
+        watch(watchers, args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,11 @@ import { Popover, PopoverContent, PopoverTrigger } from '@/components/ui/popover
 import { HexColorPicker } from 'react-colorful';
 import type { VisualElement, CustomTemplate } from '../types';
 
+// Catalog items and computed styles use numeric weights; older elements may still say 'normal'/'bold'
+const canonicalFontWeight = (weight?: string) =>
+  ({ normal: '400', bold: '700' } as Record<string, string>)[weight || 'normal'] ?? weight ?? '400';
+const isBold = (weight?: string) => Number(canonicalFontWeight(weight)) >= 600;
+
 interface RightPanelProps {
   rightPanelCollapsed: boolean;
   setRightPanelCollapsed: (collapsed: boolean) => void;
@@ -571,7 +576,7 @@ export function RightPanel({
                                   value="bold" 
                                   size="lg"
                                   className="h-10 w-10 data-[state=on]:bg-white data-[state=on]:shadow-sm focus-visible:ring-2 focus-visible:ring-blue-500"
-                                  onClick={() => updateElement(selectedElement.id, { fontWeight: selectedElement.fontWeight === 'bold' ? 'normal' : 'bold' })}
+                                  onClick={() => updateElement(selectedElement.id, { fontWeight: isBold(selectedElement.fontWeight) ? '400' : '700' })}
                                   aria-label="Bold"
                                 >
                                   <Bold className="h-4 w-4" />
@@ -656,7 +661,7 @@ export function RightPanel({
                           <div className="space-y-3">
                             <Label htmlFor="font-weight" className="text-sm text-gray-950 font-medium">Weight</Label>
                             <Select
-                              value={selectedElement.fontWeight || 'normal'}
+                              value={canonicalFontWeight(selectedElement.fontWeight)}
                               onValueChange={(value) => updateElement(selectedElement.id, { fontWeight: value })}
                             >
                               <SelectTrigger id="font-weight" className="h-10 text-sm bg-white border-gray-200 hover:border-gray-300 focus-visible:ring-2 focus-visible:ring-blue-500">
@@ -664,9 +669,9 @@ export function RightPanel({
                               </SelectTrigger>
                               <SelectContent>
                                 <SelectItem value="300">Light</SelectItem>
-                                <SelectItem value="normal">Regular</SelectItem>
+                                <SelectItem value="400">Regular</SelectItem>
                                 <SelectItem value="600">Semibold</SelectItem>
-                                <SelectItem value="bold">Bold</SelectItem>
+                                <SelectItem value="700">Bold</SelectItem>
                                 <SelectItem value="900">Black</SelectItem>
                               </SelectContent>
                             </Select>
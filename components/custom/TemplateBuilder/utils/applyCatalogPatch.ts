@@ -0,0 +1,89 @@
+/**
+ * Applies a "catalog-patch/1" delta (written by `python -m catalog.delta` or
+ * the generators' `--patch-from`) to a cached flat catalog.
+ * See catalog/delta.py for the reference implementation and the format.
+ */
+
+type CatalogRecord = { id: string } & Record<string, unknown>;
+
+export interface CatalogPatch<T extends CatalogRecord = CatalogRecord> {
+  format: 'catalog-patch/1';
+  catalog: string | null;
+  from: string;
+  to: string;
+  remove: string[];
+  add: T[];
+  modify: { id: string; set: Partial<T>; unset?: string[] }[];
+  order?: string[];
+}
+
+/** JSON with sorted keys and no whitespace, as `json.dumps(sort_keys=True, separators=(",", ":"))` writes it. */
+function canonicalJson(value: unknown): string {
+  if (Array.isArray(value)) return `[${value.map(canonicalJson).join(',')}]`;
+  if (value !== null && typeof value === 'object') {
+    const object = value as Record<string, unknown>;
+    const entries = Object.keys(object)
+      .filter((key) => object[key] !== undefined)
+      .sort()
+      .map((key) => `${JSON.stringify(key)}:${canonicalJson(object[key])}`);
+    return `{${entries.join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+/**
+ * The version of a flat catalog, as used by patches and published in shard
+ * manifests and catalog-assets.json: the first 16 hex digits of the SHA-256
+ * of its canonical JSON (catalog.delta.records_hash).
+ */
+export async function catalogVersion(records: CatalogRecord[]): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(canonicalJson(records)));
+  return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0'))
+    .join('')
+    .slice(0, 16);
+}
+
+/**
+ * Returns the patched records. `version` is the published version of the
+ * cached catalog (or the `to` of the last patch applied). If it doesn't match
+ * `from`, the patch refers to unknown items, or the result doesn't hash to
+ * `to`, an error is thrown and the caller should refetch the full catalog.
+ */
+export async function applyCatalogPatch<T extends CatalogRecord>(
+  records: T[],
+  patch: CatalogPatch<T>,
+  version: string,
+): Promise<T[]> {
+  if (patch.format !== 'catalog-patch/1') {
+    throw new Error(`Unsupported patch format: ${patch.format}`);
+  }
+  if (patch.from !== version) {
+    throw new Error(`Patch applies to ${patch.from}, catalog is ${version}`);
+  }
+
+  const removed = new Set(patch.remove);
+  const index = new Map<string, T>();
+  for (const record of records) {
+    if (!removed.has(record.id)) index.set(record.id, { ...record });
+  }
+  for (const { id, set, unset } of patch.modify) {
+    const record = index.get(id);
+    if (!record) throw new Error(`Patch modifies unknown item ${id}`);
+    Object.assign(record, set);
+    for (const key of unset ?? []) delete (record as Record<string, unknown>)[key];
+  }
+  for (const record of patch.add) index.set(record.id, record);
+
+  const order = patch.order ?? [...index.keys()];
+  const patched = order.map((id) => {
+    const record = index.get(id);
+    if (!record) throw new Error(`Patch orders unknown item ${id}`);
+    return record;
+  });
+
+  const result = await catalogVersion(patched);
+  if (result !== patch.to) {
+    throw new Error(`Patched catalog is ${result}, patch targets ${patch.to}`);
+  }
+  return patched;
+}
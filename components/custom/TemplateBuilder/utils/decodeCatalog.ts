@@ -0,0 +1,57 @@
+/**
+ * Decoder for the dictionary-encoded "compact/1" catalog format
+ * written by `generate_text_styles.py --compact` / `generate_elements.py --compact`.
+ * See catalog/compact.py for the encoder and the format description.
+ */
+
+type Cell = number | [unknown] | null;
+
+export interface CompactCatalog {
+  format: 'compact/1';
+  columns: string[];
+  strings: string[];
+  objects: Cell[][];
+  items: Cell[][];
+}
+
+export function decodeCatalog<T = Record<string, unknown>>(data: CompactCatalog): T[] {
+  if (data.format !== 'compact/1') {
+    throw new Error(`Unsupported catalog format: ${data.format}`);
+  }
+  const { columns, strings, objects } = data;
+  const decoded: Record<string, unknown>[] = [];
+
+  const value = (cell: Cell): unknown => {
+    if (Array.isArray(cell)) return cell[0];
+    if ((cell as number) >= 0) return strings[cell as number];
+    const index = -(cell as number) - 1;
+    if (!decoded[index]) {
+      const encoded = objects[index];
+      const obj: Record<string, unknown> = {};
+      for (let i = 0; i < encoded.length; i += 2) {
+        obj[strings[encoded[i] as number]] = value(encoded[i + 1]);
+      }
+      decoded[index] = obj;
+    }
+    // Shared objects are copied so callers can safely mutate an item
+    return { ...decoded[index] };
+  };
+
+  return data.items.map(row => {
+    const item: Record<string, unknown> = {};
+    row.forEach((cell, i) => {
+      if (cell !== null) item[columns[i]] = value(cell);
+    });
+    return item as T;
+  });
+}
+
+/** Regroup a decoded flat element list into the stockElements.json shape. */
+export function groupByCategory<T extends { category: string }>(items: T[]) {
+  const groups = new Map<string, Omit<T, 'category'>[]>();
+  for (const { category, ...rest } of items) {
+    if (!groups.has(category)) groups.set(category, []);
+    groups.get(category)!.push(rest);
+  }
+  return Array.from(groups, ([category, items]) => ({ category, items }));
+}